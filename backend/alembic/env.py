@@ -7,7 +7,7 @@ from sqlalchemy import pool
 
 from alembic import context
 
-# Import the application settings and models
+# Import the application settings
 import sys
 from pathlib import Path
 
@@ -15,20 +15,6 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.config import settings
-from app.database import Base
-
-# Import all models to ensure they are registered with Base.metadata
-from app.models import (
-    User,
-    RefreshToken,
-    Category,
-    Document,
-    DocumentChunk,
-    Conversation,
-    Message,
-    QueryLog,
-    DocumentView,
-)
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -42,9 +28,28 @@ config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
-# add your model's MetaData object here
-# for 'autogenerate' support
-target_metadata = Base.metadata
+
+def _load_metadata():
+    """Return the model metadata, but only for commands that compare it.
+
+    Model metadata is only consulted by autogenerate (``alembic revision
+    --autogenerate`` and ``alembic check``). Plain upgrade/downgrade/current
+    runs skip importing the model tree. When env.py is driven
+    programmatically without command-line options the models are always
+    loaded.
+    """
+    cmd_opts = config.cmd_opts
+    if cmd_opts is not None:
+        command_name = cmd_opts.cmd[0].__name__
+        if not getattr(cmd_opts, "autogenerate", False) and command_name != "check":
+            return None
+
+    # Import all models to ensure they are registered with Base.metadata
+    from app.database import Base
+    import app.models  # noqa: F401
+
+    return Base.metadata
+
 
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
@@ -67,7 +72,7 @@ def run_migrations_offline() -> None:
     url = config.get_main_option("sqlalchemy.url")
     context.configure(
         url=url,
-        target_metadata=target_metadata,
+        target_metadata=_load_metadata(),
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -92,7 +97,7 @@ def run_migrations_online() -> None:
     with connectable.connect() as connection:
         context.configure(
             connection=connection,
-            target_metadata=target_metadata,
+            target_metadata=_load_metadata(),
         )
 
         with context.begin_transaction():
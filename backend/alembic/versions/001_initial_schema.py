@@ -1,5 +1,13 @@
 """Initial schema with all models
 
+The schema is issued as a single multi-statement DDL batch rather than one
+op.create_table/op.create_index call per object, so the whole migration is
+one round-trip to the database.
+
+Only tables, primary keys, foreign keys and unique indexes are created here.
+Secondary indexes live in 002_create_secondary_indexes so they can be built
+after an initial bulk load.
+
 Revision ID: 001_initial
 Revises:
 Create Date: 2026-02-01
@@ -9,7 +17,6 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
-from sqlalchemy.dialects import postgresql
 
 # revision identifiers, used by Alembic.
 revision: str = '001_initial'
@@ -18,192 +25,165 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+# Tables, enum types and unique indexes in dependency order
+UPGRADE_DDL = """
+-- Enable pgvector extension for vector embeddings
+CREATE EXTENSION IF NOT EXISTS vector;
+
+CREATE TYPE userrole AS ENUM ('admin', 'manager', 'employee');
+CREATE TYPE documentstatus AS ENUM ('processing', 'active', 'archived');
+CREATE TYPE messagerole AS ENUM ('user', 'assistant');
+CREATE TYPE messagefeedback AS ENUM ('helpful', 'not_helpful');
+
+-- Users
+CREATE TABLE users (
+    id SERIAL NOT NULL,
+    email VARCHAR(255) NOT NULL,
+    hashed_password VARCHAR(255) NOT NULL,
+    full_name VARCHAR(100) NOT NULL,
+    role userrole NOT NULL,
+    is_active BOOLEAN DEFAULT true NOT NULL,
+    is_verified BOOLEAN DEFAULT false NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE,
+    PRIMARY KEY (id)
+);
+CREATE UNIQUE INDEX ix_users_email ON users (email);
+
+-- Refresh tokens
+CREATE TABLE refresh_tokens (
+    id SERIAL NOT NULL,
+    user_id INTEGER NOT NULL,
+    token VARCHAR(500) NOT NULL,
+    expires_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    revoked BOOLEAN DEFAULT false NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+    PRIMARY KEY (id),
+    FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE
+);
+CREATE UNIQUE INDEX ix_refresh_tokens_token ON refresh_tokens (token);
+
+-- Categories
+CREATE TABLE categories (
+    id SERIAL NOT NULL,
+    name VARCHAR(100) NOT NULL,
+    description TEXT,
+    icon VARCHAR(50),
+    parent_id INTEGER,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE,
+    PRIMARY KEY (id),
+    FOREIGN KEY (parent_id) REFERENCES categories (id) ON DELETE SET NULL
+);
+CREATE UNIQUE INDEX ix_categories_name ON categories (name);
+
+-- Documents
+CREATE TABLE documents (
+    id SERIAL NOT NULL,
+    user_id INTEGER NOT NULL,
+    category_id INTEGER,
+    title VARCHAR(255) NOT NULL,
+    description TEXT,
+    file_url VARCHAR(500) NOT NULL,
+    file_type VARCHAR(10) NOT NULL,
+    file_size INTEGER NOT NULL,
+    content TEXT,
+    status documentstatus NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE,
+    PRIMARY KEY (id),
+    FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE,
+    FOREIGN KEY (category_id) REFERENCES categories (id) ON DELETE SET NULL
+);
+
+-- Document chunks with pgvector embeddings
+CREATE TABLE document_chunks (
+    id SERIAL NOT NULL,
+    document_id INTEGER NOT NULL,
+    chunk_index INTEGER NOT NULL,
+    content TEXT NOT NULL,
+    embedding vector(1536),
+    token_count INTEGER DEFAULT 0 NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+    PRIMARY KEY (id),
+    FOREIGN KEY (document_id) REFERENCES documents (id) ON DELETE CASCADE
+);
+
+-- The HNSW similarity index is not created here: building it after the
+-- initial ingest is far cheaper than maintaining the graph row by row.
+-- Run `python -m app.scripts.build_vector_index` once documents are loaded.
+
+-- Conversations
+CREATE TABLE conversations (
+    id SERIAL NOT NULL,
+    user_id INTEGER NOT NULL,
+    title VARCHAR(255) NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE,
+    PRIMARY KEY (id),
+    FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE
+);
+
+-- Messages
+CREATE TABLE messages (
+    id SERIAL NOT NULL,
+    conversation_id INTEGER NOT NULL,
+    role messagerole NOT NULL,
+    content TEXT NOT NULL,
+    source_documents JSON,
+    feedback messagefeedback,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+    PRIMARY KEY (id),
+    FOREIGN KEY (conversation_id) REFERENCES conversations (id) ON DELETE CASCADE
+);
+
+-- Query logs
+CREATE TABLE query_logs (
+    id SERIAL NOT NULL,
+    user_id INTEGER NOT NULL,
+    question TEXT NOT NULL,
+    had_answer BOOLEAN DEFAULT true NOT NULL,
+    documents_referenced JSON,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+    PRIMARY KEY (id),
+    FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE
+);
+
+-- Document views
+CREATE TABLE document_views (
+    id SERIAL NOT NULL,
+    document_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    viewed_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+    PRIMARY KEY (id),
+    FOREIGN KEY (document_id) REFERENCES documents (id) ON DELETE CASCADE,
+    FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE
+);
+"""
+
+# Drop tables in reverse order of creation (respect foreign key constraints).
+# The vector extension is kept as other applications might use it.
+DOWNGRADE_DDL = """
+DROP TABLE document_views;
+DROP TABLE query_logs;
+DROP TABLE messages;
+DROP TABLE conversations;
+DROP TABLE document_chunks;
+DROP TABLE documents;
+DROP TABLE categories;
+DROP TABLE refresh_tokens;
+DROP TABLE users;
+
+DROP TYPE IF EXISTS messagefeedback;
+DROP TYPE IF EXISTS messagerole;
+DROP TYPE IF EXISTS documentstatus;
+DROP TYPE IF EXISTS userrole;
+"""
+
+
 def upgrade() -> None:
-    # Enable pgvector extension for vector embeddings
-    op.execute('CREATE EXTENSION IF NOT EXISTS vector')
-
-    # Create users table
-    op.create_table(
-        'users',
-        sa.Column('id', sa.Integer(), nullable=False),
-        sa.Column('email', sa.String(255), nullable=False),
-        sa.Column('hashed_password', sa.String(255), nullable=False),
-        sa.Column('full_name', sa.String(100), nullable=False),
-        sa.Column('role', sa.Enum('admin', 'manager', 'employee', name='userrole'), nullable=False),
-        sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true'),
-        sa.Column('is_verified', sa.Boolean(), nullable=False, server_default='false'),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
-        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
-        sa.PrimaryKeyConstraint('id')
-    )
-    op.create_index('ix_users_id', 'users', ['id'])
-    op.create_index('ix_users_email', 'users', ['email'], unique=True)
-
-    # Create refresh_tokens table
-    op.create_table(
-        'refresh_tokens',
-        sa.Column('id', sa.Integer(), nullable=False),
-        sa.Column('user_id', sa.Integer(), nullable=False),
-        sa.Column('token', sa.String(500), nullable=False),
-        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
-        sa.Column('revoked', sa.Boolean(), nullable=False, server_default='false'),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
-        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
-        sa.PrimaryKeyConstraint('id')
-    )
-    op.create_index('ix_refresh_tokens_id', 'refresh_tokens', ['id'])
-    op.create_index('ix_refresh_tokens_user_id', 'refresh_tokens', ['user_id'])
-    op.create_index('ix_refresh_tokens_token', 'refresh_tokens', ['token'], unique=True)
-
-    # Create categories table
-    op.create_table(
-        'categories',
-        sa.Column('id', sa.Integer(), nullable=False),
-        sa.Column('name', sa.String(100), nullable=False),
-        sa.Column('description', sa.Text(), nullable=True),
-        sa.Column('icon', sa.String(50), nullable=True),
-        sa.Column('parent_id', sa.Integer(), nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
-        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
-        sa.ForeignKeyConstraint(['parent_id'], ['categories.id'], ondelete='SET NULL'),
-        sa.PrimaryKeyConstraint('id')
-    )
-    op.create_index('ix_categories_id', 'categories', ['id'])
-    op.create_index('ix_categories_name', 'categories', ['name'], unique=True)
-    op.create_index('ix_categories_parent_id', 'categories', ['parent_id'])
-
-    # Create documents table
-    op.create_table(
-        'documents',
-        sa.Column('id', sa.Integer(), nullable=False),
-        sa.Column('user_id', sa.Integer(), nullable=False),
-        sa.Column('category_id', sa.Integer(), nullable=True),
-        sa.Column('title', sa.String(255), nullable=False),
-        sa.Column('description', sa.Text(), nullable=True),
-        sa.Column('file_url', sa.String(500), nullable=False),
-        sa.Column('file_type', sa.String(10), nullable=False),
-        sa.Column('file_size', sa.Integer(), nullable=False),
-        sa.Column('content', sa.Text(), nullable=True),
-        sa.Column('status', sa.Enum('processing', 'active', 'archived', name='documentstatus'), nullable=False),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
-        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
-        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
-        sa.ForeignKeyConstraint(['category_id'], ['categories.id'], ondelete='SET NULL'),
-        sa.PrimaryKeyConstraint('id')
-    )
-    op.create_index('ix_documents_id', 'documents', ['id'])
-    op.create_index('ix_documents_user_id', 'documents', ['user_id'])
-    op.create_index('ix_documents_category_id', 'documents', ['category_id'])
-    op.create_index('ix_documents_title', 'documents', ['title'])
-    op.create_index('ix_documents_status', 'documents', ['status'])
-    op.create_index('ix_documents_user_status', 'documents', ['user_id', 'status'])
-    op.create_index('ix_documents_category_status', 'documents', ['category_id', 'status'])
-
-    # Create document_chunks table with pgvector
-    op.create_table(
-        'document_chunks',
-        sa.Column('id', sa.Integer(), nullable=False),
-        sa.Column('document_id', sa.Integer(), nullable=False),
-        sa.Column('chunk_index', sa.Integer(), nullable=False),
-        sa.Column('content', sa.Text(), nullable=False),
-        sa.Column('embedding', postgresql.ARRAY(sa.Float()), nullable=True),  # Will be vector(1536) with pgvector
-        sa.Column('token_count', sa.Integer(), nullable=False, server_default='0'),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
-        sa.ForeignKeyConstraint(['document_id'], ['documents.id'], ondelete='CASCADE'),
-        sa.PrimaryKeyConstraint('id')
-    )
-    op.create_index('ix_document_chunks_id', 'document_chunks', ['id'])
-    op.create_index('ix_document_chunks_document_id', 'document_chunks', ['document_id'])
-    op.create_index('ix_document_chunks_document_index', 'document_chunks', ['document_id', 'chunk_index'])
-
-    # Alter embedding column to use vector type (pgvector)
-    op.execute('ALTER TABLE document_chunks DROP COLUMN embedding')
-    op.execute('ALTER TABLE document_chunks ADD COLUMN embedding vector(1536)')
-
-    # Create HNSW index for fast similarity search
-    op.execute('CREATE INDEX ix_document_chunks_embedding ON document_chunks USING hnsw (embedding vector_cosine_ops)')
-
-    # Create conversations table
-    op.create_table(
-        'conversations',
-        sa.Column('id', sa.Integer(), nullable=False),
-        sa.Column('user_id', sa.Integer(), nullable=False),
-        sa.Column('title', sa.String(255), nullable=False),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
-        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
-        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
-        sa.PrimaryKeyConstraint('id')
-    )
-    op.create_index('ix_conversations_id', 'conversations', ['id'])
-    op.create_index('ix_conversations_user_id', 'conversations', ['user_id'])
-
-    # Create messages table
-    op.create_table(
-        'messages',
-        sa.Column('id', sa.Integer(), nullable=False),
-        sa.Column('conversation_id', sa.Integer(), nullable=False),
-        sa.Column('role', sa.Enum('user', 'assistant', name='messagerole'), nullable=False),
-        sa.Column('content', sa.Text(), nullable=False),
-        sa.Column('source_documents', postgresql.JSON(), nullable=True),
-        sa.Column('feedback', sa.Enum('helpful', 'not_helpful', name='messagefeedback'), nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
-        sa.ForeignKeyConstraint(['conversation_id'], ['conversations.id'], ondelete='CASCADE'),
-        sa.PrimaryKeyConstraint('id')
-    )
-    op.create_index('ix_messages_id', 'messages', ['id'])
-    op.create_index('ix_messages_conversation_id', 'messages', ['conversation_id'])
-
-    # Create query_logs table
-    op.create_table(
-        'query_logs',
-        sa.Column('id', sa.Integer(), nullable=False),
-        sa.Column('user_id', sa.Integer(), nullable=False),
-        sa.Column('question', sa.Text(), nullable=False),
-        sa.Column('had_answer', sa.Boolean(), nullable=False, server_default='true'),
-        sa.Column('documents_referenced', postgresql.JSON(), nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
-        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
-        sa.PrimaryKeyConstraint('id')
-    )
-    op.create_index('ix_query_logs_id', 'query_logs', ['id'])
-    op.create_index('ix_query_logs_user_id', 'query_logs', ['user_id'])
-    op.create_index('ix_query_logs_created_at', 'query_logs', ['created_at'])
-
-    # Create document_views table
-    op.create_table(
-        'document_views',
-        sa.Column('id', sa.Integer(), nullable=False),
-        sa.Column('document_id', sa.Integer(), nullable=False),
-        sa.Column('user_id', sa.Integer(), nullable=False),
-        sa.Column('viewed_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
-        sa.ForeignKeyConstraint(['document_id'], ['documents.id'], ondelete='CASCADE'),
-        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
-        sa.PrimaryKeyConstraint('id')
-    )
-    op.create_index('ix_document_views_id', 'document_views', ['id'])
-    op.create_index('ix_document_views_document_id', 'document_views', ['document_id'])
-    op.create_index('ix_document_views_user_id', 'document_views', ['user_id'])
-    op.create_index('ix_document_views_document_viewed', 'document_views', ['document_id', 'viewed_at'])
-    op.create_index('ix_document_views_user_viewed', 'document_views', ['user_id', 'viewed_at'])
+    op.execute(sa.text(UPGRADE_DDL))
 
 
 def downgrade() -> None:
-    # Drop tables in reverse order of creation (respect foreign key constraints)
-    op.drop_table('document_views')
-    op.drop_table('query_logs')
-    op.drop_table('messages')
-    op.drop_table('conversations')
-    op.drop_index('ix_document_chunks_embedding', 'document_chunks')
-    op.drop_table('document_chunks')
-    op.drop_table('documents')
-    op.drop_table('categories')
-    op.drop_table('refresh_tokens')
-    op.drop_table('users')
-
-    # Drop enum types
-    op.execute('DROP TYPE IF EXISTS messagefeedback')
-    op.execute('DROP TYPE IF EXISTS messagerole')
-    op.execute('DROP TYPE IF EXISTS documentstatus')
-    op.execute('DROP TYPE IF EXISTS userrole')
-
-    # Note: We don't drop the vector extension as other applications might use it
+    op.execute(sa.text(DOWNGRADE_DDL))
@@ -0,0 +1,74 @@
+"""Create secondary indexes
+
+The non-unique indexes are kept out of the initial schema so that a fresh
+database can be bulk-loaded before they exist; building each index once over
+loaded rows is much cheaper than updating it on every insert. For a fresh
+deployment with seed data:
+
+    alembic upgrade 001_initial
+    # bulk COPY / seed data
+    alembic upgrade 002_create_secondary_indexes
+
+Each index is built with CREATE INDEX CONCURRENTLY so that writes are not
+blocked while the indexes are built on a populated database.
+
+Revision ID: 002_create_secondary_indexes
+Revises: 001_initial
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '002_create_secondary_indexes'
+down_revision: Union[str, None] = '001_initial'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, columns)
+SECONDARY_INDEXES = [
+    ("ix_users_id", "users", "id"),
+    ("ix_refresh_tokens_id", "refresh_tokens", "id"),
+    ("ix_refresh_tokens_user_id", "refresh_tokens", "user_id"),
+    ("ix_categories_id", "categories", "id"),
+    ("ix_categories_parent_id", "categories", "parent_id"),
+    ("ix_documents_id", "documents", "id"),
+    ("ix_documents_user_id", "documents", "user_id"),
+    ("ix_documents_category_id", "documents", "category_id"),
+    ("ix_documents_title", "documents", "title"),
+    ("ix_documents_status", "documents", "status"),
+    ("ix_documents_user_status", "documents", "user_id, status"),
+    ("ix_documents_category_status", "documents", "category_id, status"),
+    ("ix_document_chunks_id", "document_chunks", "id"),
+    ("ix_document_chunks_document_id", "document_chunks", "document_id"),
+    ("ix_document_chunks_document_index", "document_chunks", "document_id, chunk_index"),
+    ("ix_conversations_id", "conversations", "id"),
+    ("ix_conversations_user_id", "conversations", "user_id"),
+    ("ix_messages_id", "messages", "id"),
+    ("ix_messages_conversation_id", "messages", "conversation_id"),
+    ("ix_query_logs_id", "query_logs", "id"),
+    ("ix_query_logs_user_id", "query_logs", "user_id"),
+    ("ix_query_logs_created_at", "query_logs", "created_at"),
+    ("ix_document_views_id", "document_views", "id"),
+    ("ix_document_views_document_id", "document_views", "document_id"),
+    ("ix_document_views_user_id", "document_views", "user_id"),
+    ("ix_document_views_document_viewed", "document_views", "document_id, viewed_at"),
+    ("ix_document_views_user_viewed", "document_views", "user_id, viewed_at"),
+]
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block,
+    # and each statement has to be issued on its own
+    with op.get_context().autocommit_block():
+        for name, table, columns in SECONDARY_INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({columns})")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _table, _columns in reversed(SECONDARY_INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
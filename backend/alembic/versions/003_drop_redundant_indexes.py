@@ -0,0 +1,59 @@
+"""Drop redundant single-column indexes
+
+Every table carried an ix_<table>_id index on its primary key, duplicating
+the primary key's own unique index, and five foreign key columns had their
+own index although a composite index already leads with the same column.
+Each duplicate index is pure write amplification: it is updated on every
+insert and update, and it competes for shared_buffers, but the planner
+never needs it.
+
+Indexes are dropped and (on downgrade) recreated concurrently so writes are
+not blocked on populated tables.
+
+Revision ID: 003_drop_redundant_indexes
+Revises: 002_create_secondary_indexes
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '003_drop_redundant_indexes'
+down_revision: Union[str, None] = '002_create_secondary_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, columns)
+REDUNDANT_INDEXES = [
+    # Covered by the primary key
+    ("ix_users_id", "users", "id"),
+    ("ix_refresh_tokens_id", "refresh_tokens", "id"),
+    ("ix_categories_id", "categories", "id"),
+    ("ix_documents_id", "documents", "id"),
+    ("ix_document_chunks_id", "document_chunks", "id"),
+    ("ix_conversations_id", "conversations", "id"),
+    ("ix_messages_id", "messages", "id"),
+    ("ix_query_logs_id", "query_logs", "id"),
+    ("ix_document_views_id", "document_views", "id"),
+    # Covered by the leading column of a composite index
+    ("ix_documents_user_id", "documents", "user_id"),
+    ("ix_documents_category_id", "documents", "category_id"),
+    ("ix_document_chunks_document_id", "document_chunks", "document_id"),
+    ("ix_document_views_document_id", "document_views", "document_id"),
+    ("ix_document_views_user_id", "document_views", "user_id"),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _table, _columns in REDUNDANT_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in REDUNDANT_INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({columns})")
@@ -0,0 +1,56 @@
+"""Widen append-only table IDs to bigint and index messages by (conversation_id, id)
+
+messages, query_logs and document_views grow with every chat turn, query
+and document open and are never pruned, so their SERIAL (int4) primary keys
+are the first to run out. Their IDs and sequences are widened to bigint.
+
+Message history is now ordered by ID instead of created_at, and the plain
+conversation_id index is replaced by (conversation_id, id) so a
+conversation's messages come back in order straight from the index.
+
+Changing a column type rewrites the table under an exclusive lock; run this
+in a maintenance window on large databases.
+
+Revision ID: 004_bigint_log_table_ids
+Revises: 003_drop_redundant_indexes
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '004_bigint_log_table_ids'
+down_revision: Union[str, None] = '003_drop_redundant_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+APPEND_ONLY_TABLES = ["messages", "query_logs", "document_views"]
+
+
+def upgrade() -> None:
+    for table in APPEND_ONLY_TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id TYPE BIGINT")
+        op.execute(f"ALTER SEQUENCE {table}_id_seq AS BIGINT")
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_messages_conversation_id_id "
+            "ON messages (conversation_id, id)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_messages_conversation_id")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_messages_conversation_id "
+            "ON messages (conversation_id)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_messages_conversation_id_id")
+
+    for table in reversed(APPEND_ONLY_TABLES):
+        op.execute(f"ALTER SEQUENCE {table}_id_seq AS INTEGER")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id TYPE INTEGER")
@@ -0,0 +1,61 @@
+"""Add ordered indexes for the conversation and category document lists
+
+The conversation list filters on user_id and orders by updated_at; its
+index now carries updated_at as a key and the remaining listed columns as
+INCLUDE columns, so a page can be served by an index-only scan. It replaces
+the plain user_id index, whose lookups it also serves.
+
+The category document list filters on category_id and status and orders by
+created_at; adding created_at to the end of the existing composite lets a
+page be read in order without a sort.
+
+Index-only scans depend on the visibility map, which autovacuum keeps
+current; run VACUUM (ANALYZE) on conversations after deploying if the table
+has not been vacuumed recently.
+
+Revision ID: 005_list_endpoint_indexes
+Revises: 004_bigint_log_table_ids
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '005_list_endpoint_indexes'
+down_revision: Union[str, None] = '004_bigint_log_table_ids'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (new index definition, index it replaces, replaced index definition)
+REPLACEMENTS = [
+    (
+        "ix_conversations_user_updated ON conversations (user_id, updated_at) "
+        "INCLUDE (id, title, created_at)",
+        "ix_conversations_user_id",
+        "ix_conversations_user_id ON conversations (user_id)",
+    ),
+    (
+        "ix_documents_category_status_created ON documents (category_id, status, created_at)",
+        "ix_documents_category_status",
+        "ix_documents_category_status ON documents (category_id, status)",
+    ),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for new_index, old_name, _old_index in REPLACEMENTS:
+            # Build the replacement before dropping the old index so the
+            # queries it serves are never without one
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {new_index}")
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {old_name}")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for new_index, _old_name, old_index in reversed(REPLACEMENTS):
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {old_index}")
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {new_index.split()[0]}")
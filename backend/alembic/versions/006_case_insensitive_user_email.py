@@ -0,0 +1,38 @@
+"""Make user email uniqueness and lookup case-insensitive
+
+The unique index on users.email compared addresses case-sensitively, so
+"Jane@corp.com" and "jane@corp.com" could register as two accounts and
+logging in with a different case failed. It is replaced by a unique index
+on lower(email), which the login and registration lookups now use.
+
+The upgrade fails if existing accounts differ only by email case; merge or
+rename those accounts first. A failed concurrent build leaves an invalid
+index behind, which is dropped before retrying.
+
+Revision ID: 006_case_insensitive_user_email
+Revises: 005_list_endpoint_indexes
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '006_case_insensitive_user_email'
+down_revision: Union[str, None] = '005_list_endpoint_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_users_email_lower")
+        op.execute("CREATE UNIQUE INDEX CONCURRENTLY ix_users_email_lower ON users (lower(email))")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_users_email")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ix_users_email ON users (email)")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_users_email_lower")
@@ -0,0 +1,36 @@
+"""Replace the documents status index with (status, created_at)
+
+The document list filters on status and orders by created_at. A status
+index alone matches a large share of the table (there are only three
+statuses) and still leaves a sort; (status, created_at) returns a page in
+order. It also serves every lookup the plain status index did.
+
+Revision ID: 007_documents_status_created
+Revises: 006_case_insensitive_user_email
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '007_documents_status_created'
+down_revision: Union[str, None] = '006_case_insensitive_user_email'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_documents_status_created "
+            "ON documents (status, created_at)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_documents_status")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_documents_status ON documents (status)")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_documents_status_created")
@@ -0,0 +1,39 @@
+"""Replace the query_logs created_at B-tree with a BRIN index
+
+query_logs is append-only and every row gets created_at = now(), so heap
+order follows time. A BRIN index summarising each 32-page range answers
+time-range scans nearly as well as the B-tree while being orders of
+magnitude smaller and almost free to maintain on insert.
+
+Revision ID: 008_query_logs_created_at_brin
+Revises: 007_documents_status_created
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '008_query_logs_created_at_brin'
+down_revision: Union[str, None] = '007_documents_status_created'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_query_logs_created_at_brin "
+            "ON query_logs USING brin (created_at) WITH (pages_per_range = 32)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_query_logs_created_at")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_query_logs_created_at "
+            "ON query_logs (created_at)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_query_logs_created_at_brin")
@@ -0,0 +1,44 @@
+"""Store document chunk embeddings as halfvec
+
+Embeddings move from vector(1536) (4 bytes per dimension) to halfvec(1536)
+(2 bytes per dimension), halving the bytes read per similarity probe and
+the size of the chunk table and its HNSW index. Half precision does not
+meaningfully change cosine ranking for OpenAI embeddings.
+
+Requires pgvector 0.7 or later (run ALTER EXTENSION vector UPDATE first on
+older installations). Changing the column type rewrites document_chunks
+under an exclusive lock, and the HNSW index built for the old type is
+dropped; rebuild it afterwards with:
+
+    python -m app.scripts.build_vector_index
+
+Revision ID: 009_halfvec_embeddings
+Revises: 008_query_logs_created_at_brin
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '009_halfvec_embeddings'
+down_revision: Union[str, None] = '008_query_logs_created_at_brin'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_document_chunks_embedding")
+    op.execute(
+        "ALTER TABLE document_chunks ALTER COLUMN embedding "
+        "TYPE halfvec(1536) USING embedding::halfvec(1536)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_document_chunks_embedding")
+    op.execute(
+        "ALTER TABLE document_chunks ALTER COLUMN embedding "
+        "TYPE vector(1536) USING embedding::vector(1536)"
+    )
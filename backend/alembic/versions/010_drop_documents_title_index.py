@@ -0,0 +1,31 @@
+"""Drop the unused B-tree index on documents.title
+
+Titles are only ever searched with ILIKE '%term%', which a B-tree cannot
+serve, and nothing looks a document up or sorts by exact title. The index
+was maintained on every document insert and title edit without ever being
+used.
+
+Revision ID: 010_drop_documents_title_index
+Revises: 009_halfvec_embeddings
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '010_drop_documents_title_index'
+down_revision: Union[str, None] = '009_halfvec_embeddings'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_documents_title")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_documents_title ON documents (title)")
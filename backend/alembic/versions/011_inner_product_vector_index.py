@@ -0,0 +1,38 @@
+"""Drop the cosine HNSW index in favour of an inner-product one
+
+Embeddings are unit-length (ada-002 returns normalized vectors and the
+embedding service normalizes every vector it produces), so cosine
+similarity equals the inner product and the search now orders by
+pgvector's <#> operator. That skips the two norm computations cosine
+distance performs for every candidate. The HNSW index built with
+halfvec_cosine_ops cannot serve <#>, so it is dropped here; rebuild it
+with halfvec_ip_ops afterwards with:
+
+    python -m app.scripts.build_vector_index
+
+Revision ID: 011_inner_product_vector_index
+Revises: 010_drop_documents_title_index
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '011_inner_product_vector_index'
+down_revision: Union[str, None] = '010_drop_documents_title_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_document_chunks_embedding")
+
+
+def downgrade() -> None:
+    # The inner-product index cannot serve the cosine search either; the
+    # build script of the matching release recreates the cosine index
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_document_chunks_embedding")
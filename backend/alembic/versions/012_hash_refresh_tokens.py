@@ -0,0 +1,42 @@
+"""Store refresh tokens as SHA-256 digests
+
+refresh_tokens kept every issued refresh JWT verbatim in a varchar(500)
+column with a unique B-tree over it, so each index entry was several
+hundred bytes and anyone able to read the table could replay live tokens.
+The column is replaced by token_hash, the 32-byte SHA-256 digest of the
+token; lookups hash the presented token and probe the digest index.
+
+Existing tokens are hashed in place and keep working. The downgrade cannot
+recover the raw tokens, so it deletes every refresh token and users sign in
+again. The backfill runs inside the migration transaction and holds an
+exclusive lock on refresh_tokens while it does.
+
+Revision ID: 012_hash_refresh_tokens
+Revises: 011_inner_product_vector_index
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '012_hash_refresh_tokens'
+down_revision: Union[str, None] = '011_inner_product_vector_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE refresh_tokens ADD COLUMN token_hash BYTEA")
+    op.execute("UPDATE refresh_tokens SET token_hash = sha256(convert_to(token, 'UTF8'))")
+    op.execute("ALTER TABLE refresh_tokens ALTER COLUMN token_hash SET NOT NULL")
+    op.execute("CREATE UNIQUE INDEX ix_refresh_tokens_token_hash ON refresh_tokens (token_hash)")
+    op.execute("ALTER TABLE refresh_tokens DROP COLUMN token")
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM refresh_tokens")
+    op.execute("ALTER TABLE refresh_tokens ADD COLUMN token VARCHAR(500) NOT NULL")
+    op.execute("CREATE UNIQUE INDEX ix_refresh_tokens_token ON refresh_tokens (token)")
+    op.execute("ALTER TABLE refresh_tokens DROP COLUMN token_hash")
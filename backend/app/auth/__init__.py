@@ -1 +1,15 @@
-# Auth Package
+"""
+Authentication package for the Internal Policy Assistant.
+
+The OAuth2 bearer scheme is defined once here and shared by every
+dependency that extracts the access token.
+"""
+
+from fastapi.security import OAuth2PasswordBearer
+
+# OAuth2 scheme for token extraction from Authorization header
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login", auto_error=True)
+
+__all__ = [
+    "oauth2_scheme",
+]
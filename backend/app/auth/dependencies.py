@@ -1,17 +1,68 @@
 """FastAPI dependencies for authentication."""
 
-from typing import Callable, List
+import threading
+from typing import Callable, Iterable, Union
 
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordBearer
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
-from app.auth.jwt import decode_token
+from app.auth import oauth2_scheme
+from app.auth.jwt import TokenExpiredError, decode_token
 from app.database import get_db
 from app.models.user import User, UserRole
 
-# OAuth2 scheme for token extraction from Authorization header
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
+__all__ = [
+    "oauth2_scheme",
+    "get_current_user",
+    "get_current_active_user",
+    "require_role",
+    "invalidate_user",
+]
+
+# Short-lived cache of authenticated users keyed by user ID, so most requests
+# skip the users table entirely. The TTL is kept short so deactivations and
+# role changes propagate quickly even without an explicit invalidation.
+USER_CACHE_TTL_SECONDS = 30
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=USER_CACHE_TTL_SECONDS)
+_user_cache_lock = threading.Lock()
+
+# Columns kept in a cached snapshot (hashed_password is deliberately excluded)
+_CACHED_USER_FIELDS = (
+    "id",
+    "email",
+    "full_name",
+    "role",
+    "is_active",
+    "is_verified",
+    "created_at",
+    "updated_at",
+)
+
+
+def _snapshot_user(user: User) -> tuple:
+    """Capture the cacheable columns of a user as a plain tuple."""
+    return tuple(getattr(user, field) for field in _CACHED_USER_FIELDS)
+
+
+def _user_from_snapshot(snapshot: tuple) -> User:
+    """Rebuild a detached (transient) User from a cached snapshot."""
+    return User(**dict(zip(_CACHED_USER_FIELDS, snapshot)))
+
+
+def invalidate_user(user_id: int) -> None:
+    """
+    Drop a user from the authentication cache.
+
+    Call this after changing a user's profile, role or active flag so the
+    next request reloads the user from the database.
+
+    Args:
+        user_id: ID of the user to evict
+    """
+    with _user_cache_lock:
+        _user_cache.pop(user_id, None)
 
 
 async def get_current_user(
@@ -26,7 +77,8 @@ async def get_current_user(
         db: Database session
 
     Returns:
-        User: The authenticated user
+        User: The authenticated user. Cache hits return a detached instance,
+            so reload the user from the session before modifying it.
 
     Raises:
         HTTPException: If token is invalid or user not found
@@ -37,21 +89,45 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    payload = decode_token(token)
+    try:
+        payload = decode_token(token)
+    except TokenExpiredError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has expired",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     if not payload:
         raise credentials_exception
 
     if payload.get("type") != "access":
         raise credentials_exception
 
-    user_id = payload.get("sub")
-    if not user_id:
-        raise credentials_exception
-
-    user = db.query(User).filter(User.id == int(user_id)).first()
+    # Tokens carry the user ID as an integer "uid" claim; older tokens only
+    # have the string "sub" and are parsed the slow way
+    user_id = payload.get("uid")
+    if not isinstance(user_id, int):
+        sub = payload.get("sub")
+        if not sub or not sub.isdigit():
+            raise credentials_exception
+        user_id = int(sub)
+
+    with _user_cache_lock:
+        snapshot = _user_cache.get(user_id)
+    if snapshot is not None:
+        return _user_from_snapshot(snapshot)
+
+    # The session is synchronous; run the lookup in the threadpool so a
+    # cache miss does not block the event loop for the DB round-trip
+    user = await run_in_threadpool(db.get, User, user_id)
     if not user:
         raise credentials_exception
 
+    # Only active users are cached; inactive ones are rejected downstream
+    if user.is_active:
+        with _user_cache_lock:
+            _user_cache[user_id] = _snapshot_user(user)
+
     return user
 
 
@@ -78,23 +154,30 @@ async def get_current_active_user(
     return user
 
 
-def require_role(roles: List[UserRole]) -> Callable:
+def require_role(roles: Iterable[Union[UserRole, str]]) -> Callable:
     """
     Create a dependency that requires the user to have one of the specified roles.
 
     Args:
-        roles: List of allowed roles
+        roles: Allowed roles, as UserRole members or their string values
 
     Returns:
         Callable: A dependency function that validates user role
 
+    Raises:
+        ValueError: If a role string does not name a UserRole
+
     Usage:
         @router.get("/admin-only")
         async def admin_endpoint(user: User = Depends(require_role([UserRole.admin]))):
             return {"message": "Welcome admin"}
     """
+    # Normalize once when the dependency is built; a frozenset keeps the
+    # per-request membership test O(1) and compares enum members directly
+    allowed_roles = frozenset(UserRole(role) for role in roles)
+
     async def role_checker(user: User = Depends(get_current_active_user)) -> User:
-        if user.role not in roles:
+        if user.role not in allowed_roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Insufficient permissions"
@@ -1,42 +1,44 @@
 """JWT utilities for authentication."""
 
-from datetime import datetime, timedelta, timezone
+import hashlib
+import threading
+import time
 from typing import Optional
 
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from cachetools import TTLCache
+import jwt
+from jwt.exceptions import ExpiredSignatureError, PyJWTError
 
+from app.auth.password import (  # noqa: F401 - re-exported for existing imports
+    ahash_password,
+    averify_password,
+    hash_password,
+    verify_password,
+)
 from app.config import settings
 
-# Password hashing context using bcrypt
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Signing key encoded once instead of on every encode/decode, and a single
+# JWT codec with its options and accepted algorithms fixed at import time
+_SECRET = settings.SECRET_KEY.encode("utf-8")
+_ALGORITHM = settings.ALGORITHM
+_ALGORITHMS = [_ALGORITHM]
+_jwt = jwt.PyJWT(options={"require": ["exp"]})
 
+# Token lifetimes in seconds, computed once for the integer exp claims
+ACCESS_TOKEN_TTL_SECONDS = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+REFRESH_TOKEN_TTL_SECONDS = settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400
 
-def verify_password(plain: str, hashed: str) -> bool:
-    """
-    Verify a plain password against a hashed password.
+# Cache of verified access-token payloads keyed by a digest of the token, so a
+# token presented repeatedly is only signature-checked once per TTL. Entries
+# are never served past the token's own "exp" claim. Refresh tokens are
+# single-use and invalid tokens never repeat, so neither is admitted.
+TOKEN_CACHE_TTL_SECONDS = 60
+_token_cache: TTLCache = TTLCache(maxsize=50_000, ttl=TOKEN_CACHE_TTL_SECONDS)
+_token_cache_lock = threading.Lock()
 
-    Args:
-        plain: The plain text password
-        hashed: The hashed password to compare against
 
-    Returns:
-        bool: True if password matches, False otherwise
-    """
-    return pwd_context.verify(plain, hashed)
-
-
-def hash_password(password: str) -> str:
-    """
-    Hash a password using bcrypt.
-
-    Args:
-        password: The plain text password to hash
-
-    Returns:
-        str: The hashed password
-    """
-    return pwd_context.hash(password)
+class TokenExpiredError(Exception):
+    """Raised when a correctly signed token is past its exp claim."""
 
 
 def create_access_token(data: dict) -> str:
@@ -44,14 +46,17 @@ def create_access_token(data: dict) -> str:
     Create a JWT access token.
 
     Args:
-        data: Dictionary containing token payload data (should include "sub" key)
+        data: Dictionary containing token payload data (should include the
+            "sub" key and the integer user ID as "uid")
 
     Returns:
         str: Encoded JWT access token
     """
-    expire = datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode = {**data, "exp": expire, "type": "access"}
-    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    # Integer epoch claims avoid datetime allocation and conversion
+    now = int(time.time())
+    expire = now + ACCESS_TOKEN_TTL_SECONDS
+    to_encode = {**data, "iat": now, "exp": expire, "type": "access"}
+    return _jwt.encode(to_encode, _SECRET, algorithm=_ALGORITHM)
 
 
 def create_refresh_token(data: dict) -> str:
@@ -64,9 +69,10 @@ def create_refresh_token(data: dict) -> str:
     Returns:
         str: Encoded JWT refresh token
     """
-    expire = datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
-    to_encode = {**data, "exp": expire, "type": "refresh"}
-    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    now = int(time.time())
+    expire = now + REFRESH_TOKEN_TTL_SECONDS
+    to_encode = {**data, "iat": now, "exp": expire, "type": "refresh"}
+    return _jwt.encode(to_encode, _SECRET, algorithm=_ALGORITHM)
 
 
 def decode_token(token: str) -> Optional[dict]:
@@ -78,9 +84,36 @@ def decode_token(token: str) -> Optional[dict]:
 
     Returns:
         dict | None: Decoded token payload if valid, None otherwise
+
+    Raises:
+        TokenExpiredError: If the token is valid but has expired
     """
+    # Key by digest rather than the raw token to bound memory and keep
+    # bearer secrets out of the cache
+    cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    with _token_cache_lock:
+        cached = _token_cache.get(cache_key)
+    if cached is not None:
+        payload, expires_at = cached
+        if time.time() < expires_at:
+            # Every caller gets its own copy; the cached entry is shared
+            # across requests and threads and must never be mutated
+            return dict(payload)
+        with _token_cache_lock:
+            _token_cache.pop(cache_key, None)
+
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
-    except JWTError:
+        payload = _jwt.decode(token, _SECRET, algorithms=_ALGORITHMS)
+    except ExpiredSignatureError:
+        raise TokenExpiredError() from None
+    except PyJWTError:
+        # Invalid tokens are never cached
         return None
+
+    expires_at = payload.get("exp")
+    if payload.get("type") == "access" and isinstance(expires_at, (int, float)):
+        with _token_cache_lock:
+            _token_cache[cache_key] = (dict(payload), expires_at)
+
+    return payload
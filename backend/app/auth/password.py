@@ -0,0 +1,130 @@
+"""Password hashing utilities."""
+
+import base64
+import hashlib
+
+import bcrypt
+from fastapi.concurrency import run_in_threadpool
+
+from app.config import settings
+
+# bcrypt only looks at the first 72 bytes of its input. New hashes feed it a
+# base64 SHA-256 digest of the password (44 bytes) so long passphrases are not
+# silently truncated; they are stored with PREHASH_PREFIX in front of the
+# bcrypt hash. Unprefixed hashes are legacy raw-password bcrypt hashes, which
+# still verify and are upgraded on the next successful login.
+PREHASH_PREFIX = "sha256+"
+BCRYPT_MAX_PASSWORD_BYTES = 72
+
+# Work factor for new hashes, clamped to the range bcrypt accepts. Existing
+# hashes keep the cost they were created with and still verify.
+BCRYPT_ROUNDS = min(max(settings.BCRYPT_ROUNDS, 4), 31)
+
+# Every bcrypt hash is 60 characters with one of these version prefixes
+BCRYPT_HASH_PREFIXES = ("$2a$", "$2b$", "$2y$")
+BCRYPT_HASH_LENGTH = 60
+
+
+def _prehash_password(password: str) -> bytes:
+    """Reduce a password of any length to a fixed 44-byte bcrypt input."""
+    return base64.b64encode(hashlib.sha256(password.encode("utf-8")).digest())
+
+
+def _encode_legacy_password(password: str) -> bytes:
+    """Encode a password as legacy hashes did, truncated to bcrypt's limit."""
+    return password.encode("utf-8")[:BCRYPT_MAX_PASSWORD_BYTES]
+
+
+def verify_password(plain: str, hashed: str) -> bool:
+    """
+    Verify a plain password against a hashed password.
+
+    Args:
+        plain: The plain text password
+        hashed: The hashed password to compare against
+
+    Returns:
+        bool: True if password matches, False otherwise
+    """
+    if hashed.startswith(PREHASH_PREFIX):
+        bcrypt_hash = hashed[len(PREHASH_PREFIX):]
+        secret = _prehash_password(plain)
+    else:
+        bcrypt_hash = hashed
+        secret = _encode_legacy_password(plain)
+
+    # Reject values that cannot be bcrypt hashes before paying for the key
+    # schedule. This depends only on the stored hash's shape, never on the
+    # password, so it reveals nothing about the credentials being tried.
+    if len(bcrypt_hash) != BCRYPT_HASH_LENGTH or not bcrypt_hash.startswith(BCRYPT_HASH_PREFIXES):
+        return False
+
+    try:
+        return bcrypt.checkpw(secret, bcrypt_hash.encode("utf-8"))
+    except ValueError:
+        # Malformed or non-bcrypt hash
+        return False
+
+
+def hash_password(password: str) -> str:
+    """
+    Hash a password using SHA-256 followed by bcrypt.
+
+    Args:
+        password: The plain text password to hash
+
+    Returns:
+        str: The hashed password
+    """
+    bcrypt_hash = bcrypt.hashpw(_prehash_password(password), bcrypt.gensalt(rounds=BCRYPT_ROUNDS))
+    return PREHASH_PREFIX + bcrypt_hash.decode("utf-8")
+
+
+def needs_rehash(hashed: str) -> bool:
+    """
+    Check whether a stored hash should be replaced on the next login.
+
+    A hash needs upgrading if it uses the legacy raw-password format or was
+    created with a different cost than BCRYPT_ROUNDS.
+
+    Args:
+        hashed: The stored password hash
+
+    Returns:
+        bool: True if the hash should be regenerated from the plain password
+    """
+    if not hashed.startswith(PREHASH_PREFIX):
+        return True
+    # Format: sha256+$2b$<rounds>$<salt and digest>
+    rounds = hashed[len(PREHASH_PREFIX):].split("$")[2]
+    return rounds != f"{BCRYPT_ROUNDS:02d}"
+
+
+async def averify_password(plain: str, hashed: str) -> bool:
+    """
+    Verify a password without blocking the event loop.
+
+    bcrypt is deliberately CPU-expensive, so the check runs in the
+    threadpool instead of stalling every other request on the worker.
+
+    Args:
+        plain: The plain text password
+        hashed: The hashed password to compare against
+
+    Returns:
+        bool: True if password matches, False otherwise
+    """
+    return await run_in_threadpool(verify_password, plain, hashed)
+
+
+async def ahash_password(password: str) -> str:
+    """
+    Hash a password without blocking the event loop.
+
+    Args:
+        password: The plain text password to hash
+
+    Returns:
+        str: The hashed password
+    """
+    return await run_in_threadpool(hash_password, password)
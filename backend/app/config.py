@@ -1,5 +1,7 @@
 """Application configuration using Pydantic Settings."""
 
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings
 
 
@@ -8,10 +10,19 @@ class Settings(BaseSettings):
 
     APP_NAME: str = "Internal Policy Assistant"
     DATABASE_URL: str = "postgresql://localhost:5432/policy_assistant"
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_TIMEOUT_SECONDS: int = 5
+    DB_STATEMENT_TIMEOUT_MS: int = 30000
+    DB_NULL_POOL: bool = False
+    SQL_ECHO: bool = False
+    SLOW_QUERY_THRESHOLD_MS: int = 0
     SECRET_KEY: str = "change-me-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    BCRYPT_ROUNDS: int = 10
     OPENAI_API_KEY: str = ""
     UPLOAD_DIR: str = "./uploads"
     MAX_FILE_SIZE_MB: int = 10
@@ -23,4 +34,18 @@ class Settings(BaseSettings):
         env_file_encoding = "utf-8"
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the application settings, parsing the environment only once.
+
+    Usable as a FastAPI dependency; tests can call get_settings.cache_clear()
+    to pick up a changed environment.
+
+    Returns:
+        Settings: The process-wide settings instance
+    """
+    return Settings()
+
+
+settings = get_settings()
@@ -1,24 +1,103 @@
 """Database configuration and session management."""
 
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+import logging
+import time
+
+from sqlalchemy import MetaData, create_engine, event
+from sqlalchemy.pool import NullPool
+from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
 from app.config import settings
 
-# Create database engine with connection pooling
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20
-)
+# Create database engine with connection pooling. The pool is per process:
+# size it so that uvicorn workers x (pool size + overflow) stays within the
+# server's max_connections. Connections are recycled before typical proxy or
+# load balancer idle timeouts, and LIFO reuse keeps the hot set small so idle
+# extras age out instead of all being kept warm.
+#
+# A request that cannot get a connection within DB_POOL_TIMEOUT_SECONDS fails
+# fast instead of queueing behind a saturated pool, and DB_STATEMENT_TIMEOUT_MS
+# makes the server cancel runaway statements so they cannot hold a pooled
+# connection indefinitely.
+#
+# DB_NULL_POOL disables client-side pooling for deployments where an external
+# pooler such as PgBouncer already owns the connections (and for test runs).
+# SQL_ECHO is kept separate from any debug flag because logging every
+# statement noticeably slows requests.
+_connect_args = {}
+if settings.DB_STATEMENT_TIMEOUT_MS > 0:
+    _connect_args["options"] = f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"
+
+if settings.DB_NULL_POOL:
+    engine = create_engine(
+        settings.DATABASE_URL,
+        poolclass=NullPool,
+        connect_args=_connect_args,
+        echo=settings.SQL_ECHO
+    )
+else:
+    engine = create_engine(
+        settings.DATABASE_URL,
+        pool_pre_ping=True,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_use_lifo=True,
+        connect_args=_connect_args,
+        echo=settings.SQL_ECHO
+    )
+
+logger = logging.getLogger(__name__)
+
+
+def _log_slow_queries(engine, threshold_ms: int) -> None:
+    """
+    Log statements that take longer than threshold_ms, without their parameters.
+
+    Unlike SQL_ECHO this adds only a timer per statement and formats nothing
+    for fast queries.
+
+    Args:
+        engine: The engine to instrument
+        threshold_ms: Minimum duration in milliseconds for a statement to be logged
+    """
+    threshold = threshold_ms / 1000
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _stop_timer(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+        if elapsed >= threshold:
+            logger.warning("Slow query (%.1f ms): %s", elapsed * 1000, statement)
+
+
+if settings.SLOW_QUERY_THRESHOLD_MS > 0:
+    _log_slow_queries(engine, settings.SLOW_QUERY_THRESHOLD_MS)
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-# Create declarative base for models
-Base = declarative_base()
+# Constraint and index names derived from table and columns. The patterns
+# match PostgreSQL's own defaults (and SQLAlchemy's for index=True), so the
+# names in the models always agree with the existing schema and migrations
+# never need to spell out a name by hand.
+NAMING_CONVENTION = {
+    "ix": "ix_%(table_name)s_%(column_0_N_name)s",
+    "uq": "%(table_name)s_%(column_0_N_name)s_key",
+    "ck": "%(table_name)s_%(constraint_name)s_check",
+    "fk": "%(table_name)s_%(column_0_N_name)s_fkey",
+    "pk": "%(table_name)s_pkey",
+}
+
+
+class Base(DeclarativeBase):
+    """Declarative base class for all ORM models."""
+
+    metadata = MetaData(naming_convention=NAMING_CONVENTION)
 
 
 def get_db():
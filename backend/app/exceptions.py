@@ -15,6 +15,7 @@ class NotFoundError(AppException):
     """Raised when a requested resource is not found."""
 
     def __init__(self, resource: str):
+        self.resource = resource
         super().__init__(
             message=f"{resource} not found",
             code="NOT_FOUND",
@@ -1,5 +1,7 @@
 """FastAPI application entry point."""
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -7,10 +9,20 @@ from fastapi.responses import JSONResponse
 from app.config import settings
 from app.exceptions import AppException
 from app.routers import auth, categories, documents, policies
+from app.services.openai_client import close_openai_client
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Release shared outbound clients when the application shuts down."""
+    yield
+    close_openai_client()
+
 
 # Create FastAPI application
 app = FastAPI(
     title=settings.APP_NAME,
+    lifespan=lifespan,
     version="1.0.0",
     description="Internal Policy Assistant API",
     docs_url="/docs",
@@ -1,18 +1,22 @@
 """Base model mixins for common functionality."""
 
-from sqlalchemy import Column, DateTime, Boolean
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, Boolean
+from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
 
 class TimestampMixin:
     """Mixin that adds created_at and updated_at timestamp columns."""
 
-    created_at = Column(
+    created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
         nullable=False
     )
-    updated_at = Column(
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True),
         onupdate=func.now(),
         nullable=True
@@ -22,5 +26,5 @@ class TimestampMixin:
 class SoftDeleteMixin:
     """Mixin that adds soft delete functionality."""
 
-    is_deleted = Column(Boolean, default=False, nullable=False)
-    deleted_at = Column(DateTime(timezone=True), nullable=True)
+    is_deleted: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -1,11 +1,16 @@
 """Category model for organizing documents."""
 
-from sqlalchemy import Column, Integer, String, Text, ForeignKey
-from sqlalchemy.orm import relationship
+from typing import TYPE_CHECKING, List, Optional
+
+from sqlalchemy import Integer, String, Text, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
 from app.models.base import TimestampMixin
 
+if TYPE_CHECKING:
+    from app.models.document import Document
+
 
 class Category(Base, TimestampMixin):
     """
@@ -23,11 +28,11 @@ class Category(Base, TimestampMixin):
 
     __tablename__ = "categories"
 
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(100), unique=True, nullable=False, index=True)
-    description = Column(Text, nullable=True)
-    icon = Column(String(50), nullable=True)
-    parent_id = Column(
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False, index=True)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    icon: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    parent_id: Mapped[Optional[int]] = mapped_column(
         Integer,
         ForeignKey("categories.id", ondelete="SET NULL"),
         nullable=True,
@@ -35,22 +40,29 @@ class Category(Base, TimestampMixin):
     )
 
     # Self-referential relationship for subcategories
-    parent = relationship(
+    parent: Mapped[Optional["Category"]] = relationship(
         "Category",
         remote_side=[id],
         back_populates="children"
     )
-    children = relationship(
+    # Deleting a category leaves its subcategories and documents in place:
+    # the foreign keys are ON DELETE SET NULL, and passive_deletes lets the
+    # database do that without loading the children first. Neither
+    # collection is read through the category (the tree is built from one
+    # flat query), so loading one by accident raises.
+    children: Mapped[List["Category"]] = relationship(
         "Category",
         back_populates="parent",
-        cascade="all, delete-orphan"
+        passive_deletes=True,
+        lazy="raise_on_sql"
     )
 
     # Relationship to documents
-    documents = relationship(
+    documents: Mapped[List["Document"]] = relationship(
         "Document",
         back_populates="category",
-        cascade="all, delete-orphan"
+        passive_deletes=True,
+        lazy="raise_on_sql"
     )
 
     def __repr__(self):
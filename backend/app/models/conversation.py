@@ -1,11 +1,17 @@
 """Conversation model for chat history."""
 
-from sqlalchemy import Column, Integer, String, ForeignKey
-from sqlalchemy.orm import relationship
+from typing import TYPE_CHECKING, List
+
+from sqlalchemy import Integer, String, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
 from app.models.base import TimestampMixin
 
+if TYPE_CHECKING:
+    from app.models.message import Message
+    from app.models.user import User
+
 
 class Conversation(Base, TimestampMixin):
     """
@@ -19,22 +25,36 @@ class Conversation(Base, TimestampMixin):
 
     __tablename__ = "conversations"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("users.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
-    title = Column(String(255), nullable=False)
+    title: Mapped[str] = mapped_column(String(255), nullable=False)
 
     # Relationships
-    user = relationship("User", back_populates="conversations")
-    messages = relationship(
+    user: Mapped["User"] = relationship("User", back_populates="conversations")
+    # The history can be long, so it is only loaded where a caller asks for
+    # it with selectinload; an implicit lazy load raises instead
+    messages: Mapped[List["Message"]] = relationship(
         "Message",
         back_populates="conversation",
         cascade="all, delete-orphan",
-        order_by="Message.created_at"
+        passive_deletes=True,
+        order_by="Message.id",
+        lazy="raise_on_sql"
+    )
+
+    # Covering index for a user's conversation list: rows are read in
+    # updated_at order and every listed column comes from the index itself
+    __table_args__ = (
+        Index(
+            'ix_conversations_user_updated',
+            'user_id',
+            'updated_at',
+            postgresql_include=['id', 'title', 'created_at']
+        ),
     )
 
     def __repr__(self):
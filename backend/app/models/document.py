@@ -1,12 +1,20 @@
 """Document model for storing policy documents."""
 
 import enum
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, Enum, Index
-from sqlalchemy.orm import relationship
+from typing import TYPE_CHECKING, List, Optional
+
+from sqlalchemy import Integer, String, Text, ForeignKey, Enum, Index
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
 from app.models.base import TimestampMixin
 
+if TYPE_CHECKING:
+    from app.models.category import Category
+    from app.models.document_chunk import DocumentChunk
+    from app.models.document_view import DocumentView
+    from app.models.user import User
+
 
 class DocumentStatus(enum.Enum):
     """Enumeration of document processing statuses."""
@@ -35,50 +43,60 @@ class Document(Base, TimestampMixin):
 
     __tablename__ = "documents"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("users.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
-    category_id = Column(
+    category_id: Mapped[Optional[int]] = mapped_column(
         Integer,
         ForeignKey("categories.id", ondelete="SET NULL"),
-        nullable=True,
-        index=True
+        nullable=True
     )
-    title = Column(String(255), nullable=False, index=True)
-    description = Column(Text, nullable=True)
-    file_url = Column(String(500), nullable=False)
-    file_type = Column(String(10), nullable=False)
-    file_size = Column(Integer, nullable=False)
-    content = Column(Text, nullable=True)
-    status = Column(
+    title: Mapped[str] = mapped_column(String(255), nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    file_url: Mapped[str] = mapped_column(String(500), nullable=False)
+    file_type: Mapped[str] = mapped_column(String(10), nullable=False)
+    file_size: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Full extracted text can run to megabytes and is never shown in list or
+    # detail responses, so it is only loaded when accessed
+    content: Mapped[Optional[str]] = mapped_column(Text, nullable=True, deferred=True)
+    status: Mapped[DocumentStatus] = mapped_column(
         Enum(DocumentStatus),
         default=DocumentStatus.processing,
-        nullable=False,
-        index=True
+        nullable=False
     )
 
     # Relationships
-    user = relationship("User", back_populates="documents")
-    category = relationship("Category", back_populates="documents")
-    chunks = relationship(
+    user: Mapped["User"] = relationship("User", back_populates="documents")
+    category: Mapped[Optional["Category"]] = relationship("Category", back_populates="documents")
+    # Chunks and views are only ever queried directly; deleting a document
+    # leaves them to the ON DELETE CASCADE foreign keys
+    chunks: Mapped[List["DocumentChunk"]] = relationship(
         "DocumentChunk",
         back_populates="document",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql"
     )
-    views = relationship(
+    views: Mapped[List["DocumentView"]] = relationship(
         "DocumentView",
         back_populates="document",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql"
     )
 
-    # Composite indexes for common queries
+    # Composite indexes for common queries; their leading columns also serve
+    # plain user_id / category_id lookups and the foreign key cascades. The
+    # category index ends in created_at so a category's active documents are
+    # paged newest-first without a sort, and the status index does the same
+    # for the document list filtered by status.
     __table_args__ = (
         Index('ix_documents_user_status', 'user_id', 'status'),
-        Index('ix_documents_category_status', 'category_id', 'status'),
+        Index('ix_documents_category_status_created', 'category_id', 'status', 'created_at'),
+        Index('ix_documents_status_created', 'status', 'created_at'),
     )
 
     def __repr__(self):
@@ -1,11 +1,18 @@
 """DocumentView model for tracking document views."""
 
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, Index
-from sqlalchemy.orm import relationship
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import BigInteger, Integer, ForeignKey, DateTime, Index
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
 from app.database import Base
 
+if TYPE_CHECKING:
+    from app.models.document import Document
+    from app.models.user import User
+
 
 class DocumentView(Base):
     """
@@ -20,30 +27,29 @@ class DocumentView(Base):
 
     __tablename__ = "document_views"
 
-    id = Column(Integer, primary_key=True, index=True)
-    document_id = Column(
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    document_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("documents.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
-    user_id = Column(
+    user_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("users.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
-    viewed_at = Column(
+    viewed_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
         nullable=False
     )
 
     # Relationships
-    document = relationship("Document", back_populates="views")
-    user = relationship("User", back_populates="document_views")
+    document: Mapped["Document"] = relationship("Document", back_populates="views")
+    user: Mapped["User"] = relationship("User", back_populates="document_views")
 
-    # Composite indexes for analytics queries
+    # Composite indexes for analytics queries; their leading columns also
+    # serve document_id / user_id lookups and the foreign key cascades
     __table_args__ = (
         Index('ix_document_views_document_viewed', 'document_id', 'viewed_at'),
         Index('ix_document_views_user_viewed', 'user_id', 'viewed_at'),
@@ -1,13 +1,19 @@
 """Message model for conversation messages."""
 
 import enum
-from sqlalchemy import Column, Integer, Text, ForeignKey, Enum, DateTime
-from sqlalchemy.orm import relationship
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+
+from sqlalchemy import BigInteger, Integer, Text, ForeignKey, Enum, DateTime, Index
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import JSON
 from sqlalchemy.sql import func
 
 from app.database import Base
 
+if TYPE_CHECKING:
+    from app.models.conversation import Conversation
+
 
 class MessageRole(enum.Enum):
     """Enumeration of message roles."""
@@ -39,25 +45,30 @@ class Message(Base):
 
     __tablename__ = "messages"
 
-    id = Column(Integer, primary_key=True, index=True)
-    conversation_id = Column(
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    conversation_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("conversations.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
-    role = Column(Enum(MessageRole), nullable=False)
-    content = Column(Text, nullable=False)
-    source_documents = Column(JSON, nullable=True)
-    feedback = Column(Enum(MessageFeedback), nullable=True)
-    created_at = Column(
+    role: Mapped[MessageRole] = mapped_column(Enum(MessageRole), nullable=False)
+    content: Mapped[str] = mapped_column(Text, nullable=False)
+    source_documents: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
+    feedback: Mapped[Optional[MessageFeedback]] = mapped_column(Enum(MessageFeedback), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
         nullable=False
     )
 
     # Relationships
-    conversation = relationship("Conversation", back_populates="messages")
+    conversation: Mapped["Conversation"] = relationship("Conversation", back_populates="messages")
+
+    # Message IDs increase in insertion order, so this index returns a
+    # conversation's history already sorted without a separate sort step
+    __table_args__ = (
+        Index('ix_messages_conversation_id_id', 'conversation_id', 'id'),
+    )
 
     def __repr__(self):
         return f"<Message(id={self.id}, role={self.role.value}, conversation_id={self.conversation_id})>"
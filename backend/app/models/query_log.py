@@ -1,12 +1,18 @@
 """QueryLog model for analytics and tracking."""
 
-from sqlalchemy import Column, Integer, Text, Boolean, ForeignKey, DateTime
-from sqlalchemy.orm import relationship
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+
+from sqlalchemy import BigInteger, Integer, Text, Boolean, ForeignKey, DateTime, Index
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import JSON
 from sqlalchemy.sql import func
 
 from app.database import Base
 
+if TYPE_CHECKING:
+    from app.models.user import User
+
 
 class QueryLog(Base):
     """
@@ -23,25 +29,36 @@ class QueryLog(Base):
 
     __tablename__ = "query_logs"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    user_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
         index=True
     )
-    question = Column(Text, nullable=False)
-    had_answer = Column(Boolean, nullable=False, default=True)
-    documents_referenced = Column(JSON, nullable=True)
-    created_at = Column(
+    question: Mapped[str] = mapped_column(Text, nullable=False)
+    had_answer: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+    documents_referenced: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
-        nullable=False,
-        index=True
+        nullable=False
     )
 
     # Relationships
-    user = relationship("User", back_populates="query_logs")
+    user: Mapped["User"] = relationship("User", back_populates="query_logs")
+
+    # Rows are only ever appended with created_at = now(), so the table is
+    # physically ordered by time and a BRIN index serves time-range scans at
+    # a tiny fraction of a B-tree's size and insert cost
+    __table_args__ = (
+        Index(
+            'ix_query_logs_created_at_brin',
+            'created_at',
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32}
+        ),
+    )
 
     def __repr__(self):
         return f"<QueryLog(id={self.id}, user_id={self.user_id}, had_answer={self.had_answer})>"
@@ -1,11 +1,17 @@
 """RefreshToken model for JWT refresh token management."""
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey
-from sqlalchemy.orm import relationship
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import Integer, LargeBinary, Boolean, DateTime, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
 from app.database import Base
 
+if TYPE_CHECKING:
+    from app.models.user import User
+
 
 class RefreshToken(Base):
     """
@@ -14,7 +20,7 @@ class RefreshToken(Base):
     Attributes:
         id: Primary key
         user_id: Foreign key to users table
-        token: The refresh token string (unique, indexed)
+        token_hash: SHA-256 digest of the refresh token (unique, indexed)
         expires_at: Token expiration datetime
         revoked: Whether the token has been revoked
         created_at: Token creation timestamp
@@ -22,24 +28,26 @@ class RefreshToken(Base):
 
     __tablename__ = "refresh_tokens"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
         index=True
     )
-    token = Column(String(500), unique=True, index=True, nullable=False)
-    expires_at = Column(DateTime(timezone=True), nullable=False)
-    revoked = Column(Boolean, default=False, nullable=False)
-    created_at = Column(
+    # Only the digest is stored: a 32-byte key keeps the unique index small
+    # and a leaked table does not hand out usable tokens
+    token_hash: Mapped[bytes] = mapped_column(LargeBinary(32), unique=True, index=True, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    revoked: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
         nullable=False
     )
 
     # Relationships
-    user = relationship("User", back_populates="refresh_tokens")
+    user: Mapped["User"] = relationship("User", back_populates="refresh_tokens")
 
     def __repr__(self):
         return f"<RefreshToken(id={self.id}, user_id={self.user_id}, revoked={self.revoked})>"
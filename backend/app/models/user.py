@@ -1,12 +1,21 @@
 """User model for authentication and authorization."""
 
 import enum
-from sqlalchemy import Column, Integer, String, Boolean, Enum
-from sqlalchemy.orm import relationship
+from typing import TYPE_CHECKING, List
+
+from sqlalchemy import Integer, String, Boolean, Enum, Index, text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
 from app.models.base import TimestampMixin
 
+if TYPE_CHECKING:
+    from app.models.conversation import Conversation
+    from app.models.document import Document
+    from app.models.document_view import DocumentView
+    from app.models.query_log import QueryLog
+    from app.models.refresh_token import RefreshToken
+
 
 class UserRole(enum.Enum):
     """Enumeration of user roles."""
@@ -22,7 +31,7 @@ class User(Base, TimestampMixin):
 
     Attributes:
         id: Primary key
-        email: User's email address (unique, indexed)
+        email: User's email address (unique regardless of case)
         hashed_password: Bcrypt hashed password
         full_name: User's full name
         role: User's role (admin, manager, employee)
@@ -32,39 +41,58 @@ class User(Base, TimestampMixin):
 
     __tablename__ = "users"
 
-    id = Column(Integer, primary_key=True, index=True)
-    email = Column(String(255), unique=True, index=True, nullable=False)
-    hashed_password = Column(String(255), nullable=False)
-    full_name = Column(String(100), nullable=False)
-    role = Column(Enum(UserRole), default=UserRole.employee, nullable=False)
-    is_active = Column(Boolean, default=True, nullable=False)
-    is_verified = Column(Boolean, default=False, nullable=False)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    email: Mapped[str] = mapped_column(String(255), nullable=False)
+    hashed_password: Mapped[str] = mapped_column(String(255), nullable=False)
+    full_name: Mapped[str] = mapped_column(String(100), nullable=False)
+    role: Mapped[UserRole] = mapped_column(Enum(UserRole), default=UserRole.employee, nullable=False)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    is_verified: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
-    # Relationships
-    refresh_tokens = relationship(
+    # Relationships. These collections grow without bound and are never read
+    # through the user, so loading one by accident raises instead of pulling
+    # every row. Deletes rely on the ON DELETE CASCADE foreign keys rather
+    # than loading each collection first.
+    refresh_tokens: Mapped[List["RefreshToken"]] = relationship(
         "RefreshToken",
         back_populates="user",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql"
     )
-    documents = relationship(
+    documents: Mapped[List["Document"]] = relationship(
         "Document",
         back_populates="user",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql"
     )
-    conversations = relationship(
+    conversations: Mapped[List["Conversation"]] = relationship(
         "Conversation",
         back_populates="user",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql"
     )
-    query_logs = relationship(
+    query_logs: Mapped[List["QueryLog"]] = relationship(
         "QueryLog",
         back_populates="user",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql"
     )
-    document_views = relationship(
+    document_views: Mapped[List["DocumentView"]] = relationship(
         "DocumentView",
         back_populates="user",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql"
+    )
+
+    # Emails are unique and looked up case-insensitively. The address keeps
+    # the case the user typed; lookups must compare lower(email) to use this.
+    __table_args__ = (
+        Index('ix_users_email_lower', text('lower(email)'), unique=True),
     )
 
     def __repr__(self):
@@ -1,12 +1,14 @@
 """Authentication router for API endpoints."""
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from app.auth.dependencies import get_current_active_user
-from app.auth.jwt import create_access_token, decode_token, hash_password
+from app.auth.dependencies import get_current_active_user, invalidate_user
+from app.auth.jwt import TokenExpiredError, create_access_token, decode_token
+from app.auth.password import ahash_password
 from app.database import get_db
 from app.models.user import User
 from app.schemas.auth import RefreshRequest, RegisterRequest, Token
@@ -48,7 +50,8 @@ async def register(request: RegisterRequest, db: Session = Depends(get_db)):
     )
 
     try:
-        user = auth_service.create_user(db, user_create)
+        # Hashing the password is CPU-bound; keep it off the event loop
+        user = await run_in_threadpool(auth_service.create_user, db, user_create)
     except IntegrityError:
         db.rollback()
         raise HTTPException(
@@ -77,7 +80,7 @@ async def login(
     Raises:
         HTTPException: If credentials are invalid
     """
-    user = auth_service.authenticate_user(db, form.username, form.password)
+    user = await auth_service.authenticate_user(db, form.username, form.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -92,12 +95,12 @@ async def login(
         )
 
     # Create tokens
-    access_token = create_access_token({"sub": str(user.id)})
-    refresh_token_record = auth_service.create_refresh_token_record(db, user.id)
+    access_token = create_access_token({"sub": str(user.id), "uid": user.id})
+    refresh_token = auth_service.create_refresh_token_record(db, user.id)
 
     return Token(
         access_token=access_token,
-        refresh_token=refresh_token_record.token,
+        refresh_token=refresh_token,
         token_type="bearer"
     )
 
@@ -118,7 +121,13 @@ async def refresh_tokens(request: RefreshRequest, db: Session = Depends(get_db))
         HTTPException: If refresh token is invalid or expired
     """
     # Decode the refresh token
-    payload = decode_token(request.refresh_token)
+    try:
+        payload = decode_token(request.refresh_token)
+    except TokenExpiredError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Refresh token has expired"
+        )
     if not payload or payload.get("type") != "refresh":
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -135,7 +144,7 @@ async def refresh_tokens(request: RefreshRequest, db: Session = Depends(get_db))
 
     # Get the user
     user_id = int(payload.get("sub"))
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user or not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -146,12 +155,12 @@ async def refresh_tokens(request: RefreshRequest, db: Session = Depends(get_db))
     auth_service.revoke_refresh_token(db, request.refresh_token)
 
     # Create new tokens
-    access_token = create_access_token({"sub": str(user.id)})
+    access_token = create_access_token({"sub": str(user.id), "uid": user.id})
     new_refresh_token = auth_service.create_refresh_token_record(db, user.id)
 
     return Token(
         access_token=access_token,
-        refresh_token=new_refresh_token.token,
+        refresh_token=new_refresh_token,
         token_type="bearer"
     )
 
@@ -174,6 +183,7 @@ async def logout(
         None (204 No Content)
     """
     auth_service.revoke_refresh_token(db, request.refresh_token)
+    invalidate_user(current_user.id)
     return None
 
 
@@ -210,15 +220,25 @@ async def update_current_user_profile(
     Returns:
         UserResponse: Updated user profile
     """
+    # The authenticated user may be a cached, detached copy; load the
+    # persistent row before modifying it
+    user = db.get(User, current_user.id)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+
     # Update full_name if provided
     if update_data.full_name is not None:
-        current_user.full_name = update_data.full_name
+        user.full_name = update_data.full_name
 
     # Update password if provided
     if update_data.password is not None:
-        current_user.hashed_password = hash_password(update_data.password)
+        user.hashed_password = await ahash_password(update_data.password)
 
     db.commit()
-    db.refresh(current_user)
+    db.refresh(user)
+    invalidate_user(user.id)
 
-    return current_user
+    return user
@@ -1,9 +1,11 @@
 """Router for conversation and chat endpoints."""
 
+import asyncio
 import logging
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -30,6 +32,35 @@ router = APIRouter(
 )
 
 
+async def _save_generated_title(
+    db: Session,
+    conversation_id: int,
+    title_task: Optional[asyncio.Task]
+) -> None:
+    """
+    Wait for a generated conversation title and store it.
+
+    The reply has already been committed when this runs, so failing to save
+    the title is logged and rolled back rather than failing the request.
+
+    Args:
+        db: Database session
+        conversation_id: ID of the conversation
+        title_task: Task generating the title, or None if no title is needed
+    """
+    if title_task is None:
+        return
+
+    # generate_conversation_title falls back to the message text instead of
+    # raising, so only the database write can fail here
+    title = await title_task
+    try:
+        conversation_service.update_conversation_title(db, conversation_id, title)
+    except Exception as e:
+        logger.error("Error saving conversation title: %s", e)
+        db.rollback()
+
+
 @router.get("", response_model=ConversationListResponse)
 async def list_conversations(
     page: int = Query(1, ge=1, description="Page number"),
@@ -178,7 +209,8 @@ async def send_message(
     conversation = conversation_service.get_conversation(
         db,
         conversation_id=conversation_id,
-        user_id=current_user.id
+        user_id=current_user.id,
+        with_messages=False
     )
 
     if not conversation:
@@ -187,6 +219,13 @@ async def send_message(
             detail="Conversation not found"
         )
 
+    # Check whether this is the first user message before saving it, so
+    # the title can be generated from it
+    is_first_message = (
+        conversation.title == "New Conversation"
+        and not conversation_service.has_user_messages(db, conversation_id)
+    )
+
     # Save the user's message
     user_message = conversation_service.add_message(
         db,
@@ -195,35 +234,40 @@ async def send_message(
         content=message_data.content
     )
 
-    # Check if this is the first user message and update title if needed
-    user_messages = [m for m in conversation.messages if m.role.value == "user"]
-    if len(user_messages) == 0 and conversation.title == "New Conversation":
-        # Generate a title from the first message
-        title = ai_service.generate_conversation_title(message_data.content)
-        conversation_service.update_conversation_title(db, conversation_id, title)
+    title_task = None
+    if is_first_message:
+        # Generate a title from the first message. The title call is
+        # independent of retrieval and answering, so it runs in the
+        # threadpool alongside them; it never touches the session.
+        title_task = asyncio.create_task(
+            run_in_threadpool(ai_service.generate_conversation_title, message_data.content)
+        )
 
     try:
-        # Get relevant context using RAG
-        context, source_documents = retrieval_service.get_relevant_context(
+        # Get relevant context using RAG (embedding call plus vector search)
+        context, source_documents = await run_in_threadpool(
+            retrieval_service.get_relevant_context,
             db,
             question=message_data.content,
             limit=5
         )
 
         # Generate AI response
-        answer = ai_service.generate_answer(
+        answer = await run_in_threadpool(
+            ai_service.generate_answer,
             question=message_data.content,
             context=context
         )
 
-        # Log the query for analytics
+        # Log the query for analytics; it is committed with the reply below
         document_ids = [doc["document_id"] for doc in source_documents] if source_documents else None
         conversation_service.log_query(
             db,
             user_id=current_user.id,
             question=message_data.content,
             had_answer=len(source_documents) > 0,
-            documents_referenced=document_ids
+            documents_referenced=document_ids,
+            commit=False
         )
 
         # Save the assistant's response
@@ -242,7 +286,7 @@ async def send_message(
                 SourceDocumentResponse(**doc) for doc in assistant_message.source_documents
             ]
 
-        return MessageResponse(
+        response = MessageResponse(
             id=assistant_message.id,
             role=assistant_message.role.value,
             content=assistant_message.content,
@@ -251,16 +295,20 @@ async def send_message(
             created_at=assistant_message.created_at
         )
 
+        await _save_generated_title(db, conversation_id, title_task)
+        return response
+
     except Exception as e:
-        logger.error(f"Error processing message: {str(e)}")
+        logger.error("Error processing message: %s", e)
 
-        # Log the failed query
+        # Log the failed query; it is committed with the error reply below
         conversation_service.log_query(
             db,
             user_id=current_user.id,
             question=message_data.content,
             had_answer=False,
-            documents_referenced=None
+            documents_referenced=None,
+            commit=False
         )
 
         # Save an error message as the assistant response
@@ -274,7 +322,7 @@ async def send_message(
             source_documents=None
         )
 
-        return MessageResponse(
+        response = MessageResponse(
             id=assistant_message.id,
             role=assistant_message.role.value,
             content=assistant_message.content,
@@ -283,6 +331,16 @@ async def send_message(
             created_at=assistant_message.created_at
         )
 
+        await _save_generated_title(db, conversation_id, title_task)
+        return response
+
+    finally:
+        # Both normal paths have awaited the title by now. If an exception is
+        # escaping, the session may be unusable, so the title is dropped
+        # rather than written.
+        if title_task is not None and not title_task.done():
+            title_task.cancel()
+
 
 @router.put("/messages/{message_id}/feedback", response_model=MessageResponse)
 async def update_message_feedback(
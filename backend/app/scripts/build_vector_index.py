@@ -0,0 +1,112 @@
+"""Build the HNSW similarity index on document_chunks.embedding.
+
+The index is deliberately not part of the schema migrations: inserting
+chunks into an existing HNSW graph is far more expensive than building the
+graph once over loaded data. Run this after the initial document ingest
+(and again if the index is ever dropped for a bulk re-ingest):
+
+    python -m app.scripts.build_vector_index
+
+The index is built with CREATE INDEX CONCURRENTLY, so reads and writes on
+document_chunks continue while it is being built. It uses the inner-product
+operator class: embeddings are unit-length, so the similarity search orders
+by inner product instead of cosine distance.
+"""
+
+import argparse
+import logging
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import NullPool
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+INDEX_NAME = "ix_document_chunks_embedding"
+
+
+def build_vector_index(
+    m: int = 16,
+    ef_construction: int = 64,
+    maintenance_work_mem: str = "1GB",
+    parallel_workers: int = 2
+) -> None:
+    """
+    Build the HNSW index on document chunk embeddings if it does not exist.
+
+    A leftover invalid index from an interrupted concurrent build is dropped
+    and rebuilt.
+
+    Args:
+        m: Maximum number of connections per HNSW graph node
+        ef_construction: Size of the candidate list used while building
+        maintenance_work_mem: Memory budget for the build (e.g. "1GB")
+        parallel_workers: Value for max_parallel_maintenance_workers
+    """
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    engine = create_engine(
+        settings.DATABASE_URL,
+        poolclass=NullPool,
+        isolation_level="AUTOCOMMIT"
+    )
+
+    with engine.connect() as conn:
+        is_valid = conn.execute(
+            text("""
+                SELECT i.indisvalid
+                FROM pg_index i
+                JOIN pg_class c ON c.oid = i.indexrelid
+                WHERE c.relname = :index_name
+            """),
+            {"index_name": INDEX_NAME}
+        ).scalar()
+
+        if is_valid:
+            logger.info("Index %s already exists, nothing to do", INDEX_NAME)
+            return
+
+        if is_valid is False:
+            logger.warning("Dropping invalid index %s left by an earlier build", INDEX_NAME)
+            conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}"))
+
+        conn.execute(
+            text("SELECT set_config('maintenance_work_mem', :value, false)"),
+            {"value": maintenance_work_mem}
+        )
+        conn.execute(
+            text("SELECT set_config('max_parallel_maintenance_workers', :value, false)"),
+            {"value": str(parallel_workers)}
+        )
+
+        logger.info("Building %s (m=%d, ef_construction=%d)", INDEX_NAME, m, ef_construction)
+        conn.execute(text(
+            f"CREATE INDEX CONCURRENTLY {INDEX_NAME} "
+            f"ON document_chunks USING hnsw (embedding halfvec_ip_ops) "
+            f"WITH (m = {int(m)}, ef_construction = {int(ef_construction)})"
+        ))
+        logger.info("Index %s built", INDEX_NAME)
+
+    engine.dispose()
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--m", type=int, default=16, help="HNSW connections per node")
+    parser.add_argument("--ef-construction", type=int, default=64, help="HNSW build candidate list size")
+    parser.add_argument("--maintenance-work-mem", default="1GB", help="Memory budget for the build")
+    parser.add_argument("--parallel-workers", type=int, default=2, help="max_parallel_maintenance_workers")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+    build_vector_index(
+        m=args.m,
+        ef_construction=args.ef_construction,
+        maintenance_work_mem=args.maintenance_work_mem,
+        parallel_workers=args.parallel_workers
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,15 +3,10 @@
 import logging
 from typing import Optional
 
-from openai import OpenAI
-
-from app.config import settings
+from app.services.openai_client import get_openai_client
 
 logger = logging.getLogger(__name__)
 
-# Initialize OpenAI client
-client = OpenAI(api_key=settings.OPENAI_API_KEY)
-
 
 def build_system_prompt() -> str:
     """
@@ -91,7 +86,7 @@ def generate_answer(
         system_prompt = build_system_prompt()
         user_prompt = build_user_prompt(question, context)
 
-        response = client.chat.completions.create(
+        response = get_openai_client().chat.completions.create(
             model=model,
             messages=[
                 {"role": "system", "content": system_prompt},
@@ -112,7 +107,7 @@ def generate_answer(
         return answer.strip()
 
     except Exception as e:
-        logger.error(f"Error generating answer: {str(e)}")
+        logger.error("Error generating answer: %s", e)
         raise
 
 
@@ -128,7 +123,7 @@ def generate_conversation_title(first_message: str, max_length: int = 50) -> str
         Generated title string
     """
     try:
-        response = client.chat.completions.create(
+        response = get_openai_client().chat.completions.create(
             model="gpt-4-turbo-preview",
             messages=[
                 {
@@ -155,7 +150,7 @@ def generate_conversation_title(first_message: str, max_length: int = 50) -> str
         return title
 
     except Exception as e:
-        logger.warning(f"Error generating conversation title: {str(e)}")
+        logger.warning("Error generating conversation title: %s", e)
         # Fallback to truncated message
         return first_message[:max_length] + "..." if len(first_message) > max_length else first_message
 
@@ -171,7 +166,7 @@ def check_question_relevance(question: str) -> bool:
         True if the question seems relevant to policies/company matters
     """
     try:
-        response = client.chat.completions.create(
+        response = get_openai_client().chat.completions.create(
             model="gpt-4-turbo-preview",
             messages=[
                 {
@@ -200,6 +195,6 @@ Examples of irrelevant questions:
         return answer and answer.strip().lower() == "yes"
 
     except Exception as e:
-        logger.warning(f"Error checking question relevance: {str(e)}")
+        logger.warning("Error checking question relevance: %s", e)
         # Default to treating as relevant if check fails
         return True
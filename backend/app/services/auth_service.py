@@ -1,20 +1,26 @@
 """Authentication service for business logic."""
 
+import hashlib
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from app.auth.jwt import hash_password, verify_password, create_refresh_token
+from app.auth.jwt import create_refresh_token
+from app.auth.password import ahash_password, averify_password, hash_password, needs_rehash
 from app.config import settings
 from app.models.refresh_token import RefreshToken
 from app.models.user import User
 from app.schemas.user import UserCreate
 
+# Refresh token lifetime, computed once rather than per issued token
+_REFRESH_TOKEN_TTL = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+
 
 def get_user_by_email(db: Session, email: str) -> Optional[User]:
     """
-    Get a user by email address.
+    Get a user by email address, ignoring case.
 
     Args:
         db: Database session
@@ -23,10 +29,10 @@ def get_user_by_email(db: Session, email: str) -> Optional[User]:
     Returns:
         User | None: The user if found, None otherwise
     """
-    return db.query(User).filter(User.email == email).first()
+    return db.query(User).filter(func.lower(User.email) == email.lower()).first()
 
 
-def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
+async def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
     """
     Authenticate a user by email and password.
 
@@ -41,8 +47,14 @@ def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
     user = get_user_by_email(db, email)
     if not user:
         return None
-    if not verify_password(password, user.hashed_password):
+    if not await averify_password(password, user.hashed_password):
         return None
+
+    # Upgrade legacy or outdated hashes while the plain password is at hand
+    if needs_rehash(user.hashed_password):
+        user.hashed_password = await ahash_password(password)
+        db.commit()
+
     return user
 
 
@@ -69,35 +81,50 @@ def create_user(db: Session, user_data: UserCreate) -> User:
     return user
 
 
-def create_refresh_token_record(db: Session, user_id: int) -> RefreshToken:
+def hash_refresh_token(token: str) -> bytes:
+    """
+    Compute the digest under which a refresh token is stored.
+
+    Args:
+        token: The refresh token string
+
+    Returns:
+        bytes: The 32-byte SHA-256 digest of the token
+    """
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+
+def create_refresh_token_record(db: Session, user_id: int) -> str:
     """
     Create a refresh token record in the database.
 
+    Only the token's digest is stored, so the token itself is returned to
+    be handed to the client.
+
     Args:
         db: Database session
         user_id: The user's ID
 
     Returns:
-        RefreshToken: The created refresh token record
+        str: The new refresh token
     """
     # Generate the JWT refresh token
     token_str = create_refresh_token({"sub": str(user_id)})
 
     # Calculate expiration time
-    expires_at = datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    expires_at = datetime.now(timezone.utc) + _REFRESH_TOKEN_TTL
 
     # Create the database record
     refresh_token = RefreshToken(
         user_id=user_id,
-        token=token_str,
+        token_hash=hash_refresh_token(token_str),
         expires_at=expires_at,
         revoked=False
     )
     db.add(refresh_token)
     db.commit()
-    db.refresh(refresh_token)
 
-    return refresh_token
+    return token_str
 
 
 def revoke_refresh_token(db: Session, token: str) -> bool:
@@ -112,7 +139,7 @@ def revoke_refresh_token(db: Session, token: str) -> bool:
         bool: True if token was revoked, False if not found
     """
     refresh_token = db.query(RefreshToken).filter(
-        RefreshToken.token == token,
+        RefreshToken.token_hash == hash_refresh_token(token),
         RefreshToken.revoked == False
     ).first()
 
@@ -136,7 +163,7 @@ def get_valid_refresh_token(db: Session, token: str) -> Optional[RefreshToken]:
         RefreshToken | None: The refresh token if valid, None otherwise
     """
     refresh_token = db.query(RefreshToken).filter(
-        RefreshToken.token == token,
+        RefreshToken.token_hash == hash_refresh_token(token),
         RefreshToken.revoked == False,
         RefreshToken.expires_at > datetime.now(timezone.utc)
     ).first()
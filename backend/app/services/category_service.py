@@ -1,14 +1,37 @@
 """Category service for business logic."""
 
+import copy
+import threading
 from typing import List, Optional
 
+from cachetools import TTLCache
+from sqlalchemy import event, func
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 
 from app.models.category import Category
 from app.models.document import Document, DocumentStatus
 from app.schemas.category import CategoryCreate, CategoryUpdate
 
+# The category tree is read on every page that shows navigation but changes
+# only when a category or document is written. It is cached for a short TTL
+# and dropped whenever either model is flushed; the TTL bounds staleness from
+# other worker processes, which do not see this process's invalidations.
+CATEGORY_TREE_CACHE_TTL_SECONDS = 60
+_CATEGORY_TREE_KEY = "tree"
+_category_tree_cache: TTLCache = TTLCache(maxsize=1, ttl=CATEGORY_TREE_CACHE_TTL_SECONDS)
+_category_tree_cache_lock = threading.Lock()
+
+
+def invalidate_category_tree(*_args) -> None:
+    """Drop the cached category tree so the next read rebuilds it."""
+    with _category_tree_cache_lock:
+        _category_tree_cache.pop(_CATEGORY_TREE_KEY, None)
+
+
+for _model in (Category, Document):
+    for _event_name in ("after_insert", "after_update", "after_delete"):
+        event.listen(_model, _event_name, invalidate_category_tree)
+
 
 def get_categories(db: Session) -> List[Category]:
     """
@@ -27,12 +50,28 @@ def get_category_tree(db: Session) -> List[dict]:
     """
     Get categories as a nested tree structure.
 
+    The tree is served from a short-lived in-process cache that is dropped
+    whenever a category or document is written.
+
     Args:
         db: Database session
 
     Returns:
         List[dict]: List of root categories with nested children
     """
+    with _category_tree_cache_lock:
+        cached = _category_tree_cache.get(_CATEGORY_TREE_KEY)
+    if cached is None:
+        cached = _build_category_tree(db)
+        with _category_tree_cache_lock:
+            _category_tree_cache[_CATEGORY_TREE_KEY] = cached
+
+    # Callers get their own copy so the cached tree cannot be mutated
+    return copy.deepcopy(cached)
+
+
+def _build_category_tree(db: Session) -> List[dict]:
+    """Build the category tree with active document counts from the database."""
     # Get all categories with document counts
     categories = db.query(Category).all()
 
@@ -1,11 +1,10 @@
 """Service for managing conversations and messages."""
 
-from datetime import datetime
 from typing import List, Optional, Dict, Any
 import logging
 
-from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from sqlalchemy.orm import Session, raiseload, selectinload
+from sqlalchemy import desc, exists, func, insert, select
 
 from app.models.conversation import Conversation
 from app.models.message import Message, MessageRole, MessageFeedback
@@ -40,17 +39,18 @@ def get_conversations(
         Conversation.user_id == user_id
     ).count()
 
+    # Count messages only for the conversations on this page, rather than
+    # joining and grouping every conversation the user has
+    message_count = select(func.count(Message.id)).where(
+        Message.conversation_id == Conversation.id
+    ).correlate(Conversation).scalar_subquery()
+
     # Get conversations with message count
     conversations = db.query(
         Conversation,
-        func.count(Message.id).label("message_count")
-    ).outerjoin(
-        Message,
-        Conversation.id == Message.conversation_id
+        message_count.label("message_count")
     ).filter(
         Conversation.user_id == user_id
-    ).group_by(
-        Conversation.id
     ).order_by(
         desc(Conversation.updated_at)
     ).offset(offset).limit(per_page).all()
@@ -81,7 +81,8 @@ def get_conversations(
 def get_conversation(
     db: Session,
     conversation_id: int,
-    user_id: Optional[int] = None
+    user_id: Optional[int] = None,
+    with_messages: bool = True
 ) -> Optional[Conversation]:
     """
     Get a conversation by ID with its messages.
@@ -90,24 +91,26 @@ def get_conversation(
         db: Database session
         conversation_id: ID of the conversation
         user_id: Optional user ID for ownership verification
+        with_messages: Load the full message history. Pass False when only
+            the conversation row is needed, e.g. for an ownership check.
 
     Returns:
         Conversation object or None if not found
     """
-    query = db.query(Conversation).filter(Conversation.id == conversation_id)
+    # Messages are loaded in the relationship's order (by ID); any other
+    # relationship access raises instead of issuing a hidden query
+    options = [raiseload("*")]
+    if with_messages:
+        options.insert(0, selectinload(Conversation.messages))
+
+    query = db.query(Conversation).options(*options).filter(
+        Conversation.id == conversation_id
+    )
 
     if user_id is not None:
         query = query.filter(Conversation.user_id == user_id)
 
-    conversation = query.first()
-
-    if conversation:
-        # Ensure messages are loaded and ordered
-        conversation.messages = db.query(Message).filter(
-            Message.conversation_id == conversation_id
-        ).order_by(Message.created_at).all()
-
-    return conversation
+    return query.first()
 
 
 def create_conversation(
@@ -160,7 +163,7 @@ def update_conversation_title(
 
     if conversation:
         conversation.title = title
-        conversation.updated_at = datetime.utcnow()
+        conversation.updated_at = func.now()
         db.commit()
         db.refresh(conversation)
 
@@ -227,12 +230,11 @@ def add_message(
 
     db.add(message)
 
-    # Update conversation's updated_at timestamp
-    conversation = db.query(Conversation).filter(
+    # Bump the conversation's updated_at in the database clock without
+    # loading the conversation row first
+    db.query(Conversation).filter(
         Conversation.id == conversation_id
-    ).first()
-    if conversation:
-        conversation.updated_at = datetime.utcnow()
+    ).update({Conversation.updated_at: func.now()}, synchronize_session=False)
 
     db.commit()
     db.refresh(message)
@@ -271,33 +273,60 @@ def log_query(
     user_id: int,
     question: str,
     had_answer: bool,
-    documents_referenced: Optional[List[int]] = None
-) -> QueryLog:
+    documents_referenced: Optional[List[int]] = None,
+    commit: bool = True
+) -> None:
     """
     Log a query for analytics.
 
+    The row is written with a single Core INSERT: nothing reads a log entry
+    back, so there is no ORM object to track or refresh.
+
     Args:
         db: Database session
         user_id: ID of the user who made the query
         question: The question asked
         had_answer: Whether relevant documents were found
         documents_referenced: List of document IDs referenced in the answer
-
-    Returns:
-        Created QueryLog object
+        commit: Commit immediately. Pass False to write the entry as part
+            of the caller's transaction, which the caller then commits.
     """
-    query_log = QueryLog(
-        user_id=user_id,
-        question=question,
-        had_answer=had_answer,
-        documents_referenced=documents_referenced
+    db.execute(
+        insert(QueryLog).values(
+            user_id=user_id,
+            question=question,
+            had_answer=had_answer,
+            documents_referenced=documents_referenced
+        )
     )
 
-    db.add(query_log)
-    db.commit()
-    db.refresh(query_log)
+    if commit:
+        db.commit()
+
+
+def has_user_messages(
+    db: Session,
+    conversation_id: int
+) -> bool:
+    """
+    Check whether the user has posted anything in a conversation yet.
+
+    Answered with an EXISTS probe on the (conversation_id, id) index
+    rather than by loading the conversation's history.
+
+    Args:
+        db: Database session
+        conversation_id: ID of the conversation
 
-    return query_log
+    Returns:
+        True if the conversation has at least one user message
+    """
+    return db.query(
+        exists().where(
+            Message.conversation_id == conversation_id,
+            Message.role == MessageRole.user
+        )
+    ).scalar()
 
 
 def get_conversation_messages(
@@ -318,7 +347,7 @@ def get_conversation_messages(
     """
     return db.query(Message).filter(
         Message.conversation_id == conversation_id
-    ).order_by(Message.created_at).limit(limit).all()
+    ).order_by(Message.id).limit(limit).all()
 
 
 def get_message(
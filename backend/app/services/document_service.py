@@ -6,7 +6,7 @@ from typing import Optional, List
 
 from fastapi import UploadFile
 from sqlalchemy import or_, func
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, raiseload
 
 from app.models.document import Document, DocumentStatus
 from app.models.category import Category
@@ -41,9 +41,12 @@ class DocumentService:
         Returns:
             Tuple of (documents, total_count)
         """
+        # Owner and category are rendered with every document; any other
+        # relationship access raises instead of issuing one query per row
         query = db.query(Document).options(
-            joinedload(Document.user),
-            joinedload(Document.category)
+            joinedload(Document.user, innerjoin=True),
+            joinedload(Document.category),
+            raiseload("*")
         )
 
         # Apply user filter if provided
@@ -91,8 +94,9 @@ class DocumentService:
             NotFoundError: If document not found
         """
         document = db.query(Document).options(
-            joinedload(Document.user),
-            joinedload(Document.category)
+            joinedload(Document.user, innerjoin=True),
+            joinedload(Document.category),
+            raiseload("*")
         ).filter(Document.id == document_id).first()
 
         if not document:
@@ -156,7 +160,7 @@ class DocumentService:
                 db.commit()
                 db.refresh(document)
         except Exception as e:
-            logger.error(f"Failed to extract text from document {document.id}: {e}")
+            logger.error("Failed to extract text from document %s: %s", document.id, e)
             document.status = DocumentStatus.active  # Still mark as active
             db.commit()
 
@@ -253,7 +257,7 @@ class DocumentService:
         elif file_type == "txt":
             return self._extract_text_from_txt(file_path)
         else:
-            logger.warning(f"Unsupported file type for text extraction: {file_type}")
+            logger.warning("Unsupported file type for text extraction: %s", file_type)
             return ""
 
     def _extract_text_from_pdf(self, file_path: str) -> str:
@@ -274,7 +278,7 @@ class DocumentService:
             logger.error("PyPDF2 not installed. Install it with: pip install PyPDF2")
             return ""
         except Exception as e:
-            logger.error(f"Failed to extract text from PDF {file_path}: {e}")
+            logger.error("Failed to extract text from PDF %s: %s", file_path, e)
             return ""
 
     def _extract_text_from_docx(self, file_path: str) -> str:
@@ -294,7 +298,7 @@ class DocumentService:
             logger.error("python-docx not installed. Install it with: pip install python-docx")
             return ""
         except Exception as e:
-            logger.error(f"Failed to extract text from DOCX {file_path}: {e}")
+            logger.error("Failed to extract text from DOCX %s: %s", file_path, e)
             return ""
 
     def _extract_text_from_txt(self, file_path: str) -> str:
@@ -303,7 +307,7 @@ class DocumentService:
             with open(file_path, "r", encoding="utf-8") as f:
                 return f.read()
         except Exception as e:
-            logger.error(f"Failed to read text file {file_path}: {e}")
+            logger.error("Failed to read text file %s: %s", file_path, e)
             return ""
 
 
@@ -1,23 +1,51 @@
 """Service for generating embeddings and processing documents for RAG."""
 
+import hashlib
+import math
+import threading
 import tiktoken
 from typing import List, Optional
 import logging
 
-from openai import OpenAI
+from cachetools import TTLCache
+from sqlalchemy import insert, text
 from sqlalchemy.orm import Session
 
-from app.config import settings
+from app.services.openai_client import get_openai_client
 from app.models.document_chunk import DocumentChunk
 
 logger = logging.getLogger(__name__)
 
-# Initialize OpenAI client
-client = OpenAI(api_key=settings.OPENAI_API_KEY)
-
 # Initialize tokenizer for text chunking
 ENCODING = tiktoken.get_encoding("cl100k_base")
 
+# Embeddings of recent search queries keyed by a SHA-256 digest of the
+# normalized text. The same policy questions are asked repeatedly and a
+# text's embedding never changes for a given model, so repeats skip the
+# OpenAI round-trip.
+QUERY_EMBEDDING_CACHE_TTL_SECONDS = 600
+_query_embedding_cache: TTLCache = TTLCache(maxsize=2048, ttl=QUERY_EMBEDDING_CACHE_TTL_SECONDS)
+_query_embedding_cache_lock = threading.Lock()
+
+
+def normalize_embedding(embedding: List[float]) -> List[float]:
+    """
+    Scale an embedding to unit length.
+
+    Similarity search ranks by inner product, which equals cosine similarity
+    only for unit-length vectors.
+
+    Args:
+        embedding: The embedding vector
+
+    Returns:
+        The L2-normalized vector (unchanged if it is all zeros)
+    """
+    norm = math.sqrt(math.fsum(x * x for x in embedding))
+    if norm == 0:
+        return embedding
+    return [x / norm for x in embedding]
+
 
 def generate_embedding(text: str) -> List[float]:
     """
@@ -27,7 +55,8 @@ def generate_embedding(text: str) -> List[float]:
         text: The text to generate an embedding for
 
     Returns:
-        List of floats representing the embedding vector (1536 dimensions)
+        List of floats representing the unit-length embedding vector
+        (1536 dimensions)
 
     Raises:
         Exception: If the OpenAI API call fails
@@ -43,17 +72,49 @@ def generate_embedding(text: str) -> List[float]:
         if len(tokens) > 8000:
             text = ENCODING.decode(tokens[:8000])
 
-        response = client.embeddings.create(
+        response = get_openai_client().embeddings.create(
             input=text,
             model="text-embedding-ada-002"
         )
 
-        return response.data[0].embedding
+        # ada-002 already returns unit-length vectors; normalizing again is
+        # cheap insurance for the inner-product search
+        return normalize_embedding(response.data[0].embedding)
     except Exception as e:
-        logger.error(f"Error generating embedding: {str(e)}")
+        logger.error("Error generating embedding: %s", e)
         raise
 
 
+def generate_query_embedding(text: str) -> List[float]:
+    """
+    Generate the embedding for a search query, reusing recent results.
+
+    Args:
+        text: The query text to generate an embedding for
+
+    Returns:
+        List of floats representing the embedding vector (1536 dimensions)
+
+    Raises:
+        Exception: If the OpenAI API call fails
+    """
+    normalized = text.replace("\n", " ").strip()
+    cache_key = hashlib.sha256(normalized.encode("utf-8")).digest()
+
+    with _query_embedding_cache_lock:
+        cached = _query_embedding_cache.get(cache_key)
+    if cached is not None:
+        return list(cached)
+
+    embedding = generate_embedding(normalized)
+
+    # Stored as a tuple so callers can never mutate the shared entry
+    with _query_embedding_cache_lock:
+        _query_embedding_cache[cache_key] = tuple(embedding)
+
+    return embedding
+
+
 def count_tokens(text: str) -> int:
     """
     Count the number of tokens in a text string.
@@ -169,39 +230,39 @@ def process_document_for_rag(
         chunks = chunk_text(content, max_tokens=max_tokens)
 
         if not chunks:
-            logger.warning(f"No chunks generated for document {document_id}")
+            logger.warning("No chunks generated for document %s", document_id)
             return []
 
-        created_chunks = []
+        rows = []
 
         for index, chunk_content in enumerate(chunks):
-            # Generate embedding for this chunk
-            embedding = generate_embedding(chunk_content)
-            token_count = count_tokens(chunk_content)
-
-            # Create the chunk record
-            chunk = DocumentChunk(
-                document_id=document_id,
-                chunk_index=index,
-                content=chunk_content,
-                embedding=embedding,
-                token_count=token_count
-            )
-
-            db.add(chunk)
-            created_chunks.append(chunk)
+            rows.append({
+                "document_id": document_id,
+                "chunk_index": index,
+                "content": chunk_content,
+                "embedding": generate_embedding(chunk_content),
+                "token_count": count_tokens(chunk_content)
+            })
+
+        # Chunks can be regenerated from the document at any time, so this
+        # transaction does not need to wait for the WAL flush on commit
+        db.execute(text("SET LOCAL synchronous_commit = off"))
+
+        # One batched INSERT ... RETURNING for all chunks instead of a flush
+        # per object followed by a refresh query per chunk
+        created_chunks = list(db.scalars(
+            insert(DocumentChunk).returning(DocumentChunk),
+            rows
+        ))
 
         db.commit()
 
-        for chunk in created_chunks:
-            db.refresh(chunk)
-
-        logger.info(f"Created {len(created_chunks)} chunks for document {document_id}")
+        logger.info("Created %s chunks for document %s", len(created_chunks), document_id)
         return created_chunks
 
     except Exception as e:
         db.rollback()
-        logger.error(f"Error processing document {document_id} for RAG: {str(e)}")
+        logger.error("Error processing document %s for RAG: %s", document_id, e)
         raise
 
 
@@ -229,5 +290,5 @@ def update_chunk_embedding(db: Session, chunk_id: int) -> Optional[DocumentChunk
         return chunk
     except Exception as e:
         db.rollback()
-        logger.error(f"Error updating embedding for chunk {chunk_id}: {str(e)}")
+        logger.error("Error updating embedding for chunk %s: %s", chunk_id, e)
         raise
@@ -0,0 +1,60 @@
+"""Shared OpenAI client for the AI and embedding services."""
+
+import threading
+from typing import TYPE_CHECKING, Optional
+
+from app.config import settings
+
+if TYPE_CHECKING:
+    from openai import OpenAI
+
+# One client per process so chat and embedding calls share a single HTTP
+# connection pool (keep-alive and TLS sessions to the API are reused).
+# The pool is sized for the threadpool that runs the sync service calls,
+# and idle connections are kept long enough to survive gaps between requests.
+OPENAI_MAX_CONNECTIONS = 40
+OPENAI_MAX_KEEPALIVE_CONNECTIONS = 20
+OPENAI_KEEPALIVE_EXPIRY_SECONDS = 60.0
+OPENAI_TIMEOUT_SECONDS = 60.0
+OPENAI_CONNECT_TIMEOUT_SECONDS = 5.0
+
+_client: Optional["OpenAI"] = None
+_client_lock = threading.Lock()
+
+
+def get_openai_client() -> "OpenAI":
+    """
+    Get the process-wide OpenAI client, creating it on first use.
+
+    Returns:
+        OpenAI: The shared client
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                import httpx
+                from openai import OpenAI
+
+                http_client = httpx.Client(
+                    limits=httpx.Limits(
+                        max_connections=OPENAI_MAX_CONNECTIONS,
+                        max_keepalive_connections=OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+                        keepalive_expiry=OPENAI_KEEPALIVE_EXPIRY_SECONDS,
+                    ),
+                    timeout=httpx.Timeout(
+                        OPENAI_TIMEOUT_SECONDS,
+                        connect=OPENAI_CONNECT_TIMEOUT_SECONDS,
+                    ),
+                )
+                _client = OpenAI(api_key=settings.OPENAI_API_KEY, http_client=http_client)
+    return _client
+
+
+def close_openai_client() -> None:
+    """Close the shared client's connection pool, if it was created."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
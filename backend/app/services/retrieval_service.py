@@ -3,12 +3,12 @@
 from typing import List, Tuple, Dict, Any
 import logging
 
-from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import select
+from sqlalchemy.orm import Session, contains_eager
 
 from app.models.document_chunk import DocumentChunk
 from app.models.document import Document, DocumentStatus
-from app.services.embedding_service import generate_embedding
+from app.services.embedding_service import generate_query_embedding
 
 logger = logging.getLogger(__name__)
 
@@ -29,53 +29,36 @@ def search_similar_chunks(
         similarity_threshold: Minimum similarity score (0-1) to include in results
 
     Returns:
-        List of tuples containing (DocumentChunk, similarity_score)
+        List of tuples containing (DocumentChunk, similarity_score), with each
+        chunk's document already loaded
     """
     try:
-        # Convert embedding to string format for pgvector
-        embedding_str = f"[{','.join(map(str, query_embedding))}]"
-
-        # Use pgvector's cosine distance operator (<=>)
-        # Note: cosine_distance = 1 - cosine_similarity, so we convert back
-        query = text("""
-            SELECT
-                dc.id,
-                dc.document_id,
-                dc.chunk_index,
-                dc.content,
-                dc.token_count,
-                dc.created_at,
-                1 - (dc.embedding <=> :embedding::vector) as similarity
-            FROM document_chunks dc
-            JOIN documents d ON dc.document_id = d.id
-            WHERE d.status = :active_status
-                AND dc.embedding IS NOT NULL
-                AND 1 - (dc.embedding <=> :embedding::vector) >= :threshold
-            ORDER BY dc.embedding <=> :embedding::vector
-            LIMIT :limit
-        """)
-
+        # Embeddings are unit-length, so cosine similarity is just the inner
+        # product. pgvector's <#> operator returns the negated inner product
+        # (smaller is closer), which is what the HNSW index orders by.
+        distance = DocumentChunk.embedding.max_inner_product(query_embedding)
+        similarity = -distance
+
+        # A single query returns the top chunks together with their documents.
+        # The embedding column is deferred, so no vectors come back over the
+        # wire, only each hit's text and metadata.
         result = db.execute(
-            query,
-            {
-                "embedding": embedding_str,
-                "active_status": DocumentStatus.active.value,
-                "threshold": similarity_threshold,
-                "limit": limit
-            }
+            select(DocumentChunk, similarity.label("similarity"))
+            .join(DocumentChunk.document)
+            .options(contains_eager(DocumentChunk.document))
+            .where(
+                Document.status == DocumentStatus.active,
+                DocumentChunk.embedding.is_not(None),
+                similarity >= similarity_threshold
+            )
+            .order_by(distance)
+            .limit(limit)
         )
 
-        chunks_with_scores = []
-        for row in result:
-            # Fetch the full chunk object
-            chunk = db.query(DocumentChunk).filter(DocumentChunk.id == row.id).first()
-            if chunk:
-                chunks_with_scores.append((chunk, row.similarity))
-
-        return chunks_with_scores
+        return [(chunk, score) for chunk, score in result]
 
     except Exception as e:
-        logger.error(f"Error searching similar chunks: {str(e)}")
+        logger.error("Error searching similar chunks: %s", e)
         raise
 
 
@@ -99,7 +82,7 @@ def get_relevant_context(
     """
     try:
         # Generate embedding for the question
-        query_embedding = generate_embedding(question)
+        query_embedding = generate_query_embedding(question)
 
         # Search for similar chunks
         chunks_with_scores = search_similar_chunks(
@@ -122,8 +105,8 @@ def get_relevant_context(
             if total_tokens + chunk.token_count > max_context_tokens:
                 break
 
-            # Get document info
-            document = db.query(Document).filter(Document.id == chunk.document_id).first()
+            # Loaded by the similarity search together with the chunk
+            document = chunk.document
 
             if document:
                 # Add to context
@@ -144,7 +127,7 @@ def get_relevant_context(
         return context, source_documents
 
     except Exception as e:
-        logger.error(f"Error getting relevant context: {str(e)}")
+        logger.error("Error getting relevant context: %s", e)
         raise
 
 
@@ -184,7 +167,7 @@ def search_documents_by_text(
         List of document search results with relevance scores
     """
     try:
-        query_embedding = generate_embedding(search_text)
+        query_embedding = generate_query_embedding(search_text)
         chunks_with_scores = search_similar_chunks(
             db,
             query_embedding,
@@ -198,7 +181,7 @@ def search_documents_by_text(
             doc_id = chunk.document_id
 
             if doc_id not in document_scores:
-                document = db.query(Document).filter(Document.id == doc_id).first()
+                document = chunk.document
                 if document:
                     document_scores[doc_id] = {
                         "document_id": doc_id,
@@ -224,5 +207,5 @@ def search_documents_by_text(
         return sorted_results
 
     except Exception as e:
-        logger.error(f"Error searching documents: {str(e)}")
+        logger.error("Error searching documents: %s", e)
         raise
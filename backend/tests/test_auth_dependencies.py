@@ -0,0 +1,156 @@
+"""Tests for the authentication dependencies."""
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+from unittest.mock import MagicMock, patch
+from fastapi import HTTPException
+
+from app.auth import dependencies
+from app.auth.dependencies import get_current_user, invalidate_user, require_role
+from app.auth.jwt import TokenExpiredError, create_access_token
+from app.models.user import User, UserRole
+
+
+@pytest.fixture(autouse=True)
+def clear_user_cache():
+    """Start every test with an empty user cache."""
+    dependencies._user_cache.clear()
+    yield
+    dependencies._user_cache.clear()
+
+
+@pytest.fixture
+def db_user():
+    """Create a user as returned from the database."""
+    return User(
+        id=1,
+        email="test@example.com",
+        hashed_password="not-a-real-hash",
+        full_name="Test User",
+        role=UserRole.employee,
+        is_active=True,
+        is_verified=True,
+        created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+@pytest.fixture
+def mock_db(db_user):
+    """Create a mock database session that returns db_user."""
+    db = MagicMock()
+    db.get.return_value = db_user
+    return db
+
+
+def authenticate(token, db):
+    """Run the async get_current_user dependency synchronously."""
+    return asyncio.run(get_current_user(token=token, db=db))
+
+
+class TestGetCurrentUserCache:
+    """Test cases for the in-process user cache."""
+
+    def test_second_request_is_served_from_cache(self, mock_db):
+        """Test that a cached user does not hit the database again."""
+        token = create_access_token({"sub": "1"})
+
+        first = authenticate(token, mock_db)
+        second = authenticate(token, mock_db)
+
+        assert mock_db.get.call_count == 1
+        assert second.id == first.id == 1
+        assert second.email == "test@example.com"
+        assert second.role == UserRole.employee
+
+    def test_cached_user_excludes_password_hash(self, mock_db):
+        """Test that the cached snapshot does not keep the password hash."""
+        token = create_access_token({"sub": "1"})
+
+        authenticate(token, mock_db)
+        cached = authenticate(token, mock_db)
+
+        assert cached.hashed_password is None
+
+    def test_invalidate_user_forces_reload(self, mock_db):
+        """Test that invalidate_user evicts the cached entry."""
+        token = create_access_token({"sub": "1"})
+
+        authenticate(token, mock_db)
+        invalidate_user(1)
+        authenticate(token, mock_db)
+
+        assert mock_db.get.call_count == 2
+
+    def test_inactive_user_is_not_cached(self, mock_db, db_user):
+        """Test that inactive users are always reloaded from the database."""
+        db_user.is_active = False
+        token = create_access_token({"sub": "1"})
+
+        authenticate(token, mock_db)
+        authenticate(token, mock_db)
+
+        assert mock_db.get.call_count == 2
+
+    def test_unknown_user_returns_401(self, mock_db):
+        """Test that a token for a missing user is rejected."""
+        mock_db.get.return_value = None
+        token = create_access_token({"sub": "42"})
+
+        with pytest.raises(HTTPException) as exc_info:
+            authenticate(token, mock_db)
+
+        assert exc_info.value.status_code == 401
+
+    def test_uid_claim_is_preferred_over_sub(self, mock_db):
+        """Test that the integer uid claim is used when present."""
+        token = create_access_token({"sub": "999", "uid": 1})
+
+        user = authenticate(token, mock_db)
+
+        assert user.id == 1
+        mock_db.get.assert_called_once_with(User, 1)
+
+    def test_non_numeric_sub_returns_401(self, mock_db):
+        """Test that a token without a usable user ID is rejected."""
+        token = create_access_token({"sub": "not-a-number"})
+
+        with pytest.raises(HTTPException) as exc_info:
+            authenticate(token, mock_db)
+
+        assert exc_info.value.status_code == 401
+
+    def test_expired_token_returns_401(self, mock_db):
+        """Test that an expired token is rejected with a specific message."""
+        with patch.object(dependencies, "decode_token", side_effect=TokenExpiredError):
+            with pytest.raises(HTTPException) as exc_info:
+                authenticate("expired-token", mock_db)
+
+        assert exc_info.value.status_code == 401
+        assert exc_info.value.detail == "Token has expired"
+        mock_db.get.assert_not_called()
+
+
+class TestRequireRole:
+    """Test cases for the require_role dependency factory."""
+
+    def test_accepts_role_strings(self, db_user):
+        """Test that roles may be given as strings as well as enums."""
+        checker = require_role(["admin", UserRole.employee])
+
+        assert asyncio.run(checker(user=db_user)) is db_user
+
+    def test_rejects_other_roles(self, db_user):
+        """Test that a user outside the allowed roles gets 403."""
+        checker = require_role([UserRole.admin, "manager"])
+
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(checker(user=db_user))
+
+        assert exc_info.value.status_code == 403
+
+    def test_unknown_role_string_raises(self):
+        """Test that a misspelt role fails when the dependency is built."""
+        with pytest.raises(ValueError):
+            require_role(["superuser"])
@@ -0,0 +1,97 @@
+"""Tests for JWT token utilities."""
+
+import pytest
+from unittest.mock import patch
+
+from app.auth import jwt as jwt_utils
+from app.auth.jwt import (
+    TokenExpiredError,
+    create_access_token,
+    create_refresh_token,
+    decode_token,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    """Start every test with an empty token cache."""
+    jwt_utils._token_cache.clear()
+    yield
+    jwt_utils._token_cache.clear()
+
+
+class TestDecodeTokenCache:
+    """Test cases for the verified-payload cache in decode_token."""
+
+    def test_repeated_decode_verifies_signature_once(self):
+        """Test that a cached token skips signature verification."""
+        token = create_access_token({"sub": "1"})
+
+        with patch.object(jwt_utils._jwt, "decode", wraps=jwt_utils._jwt.decode) as mock_decode:
+            first = decode_token(token)
+            second = decode_token(token)
+
+        assert mock_decode.call_count == 1
+        assert first == second
+        assert second["sub"] == "1"
+
+    def test_mutating_payload_does_not_affect_cache(self):
+        """Test that callers cannot change the cached payload."""
+        token = create_access_token({"sub": "1"})
+
+        first = decode_token(token)
+        first.pop("sub")
+        second = decode_token(token)
+        second["sub"] = "2"
+
+        assert decode_token(token)["sub"] == "1"
+
+    def test_invalid_token_is_not_cached(self):
+        """Test that tokens failing verification are not cached."""
+        assert decode_token("not-a-jwt") is None
+        assert len(jwt_utils._token_cache) == 0
+
+    def test_refresh_token_is_not_cached(self):
+        """Test that single-use refresh tokens do not occupy the cache."""
+        token = create_refresh_token({"sub": "1"})
+
+        assert decode_token(token)["type"] == "refresh"
+        assert len(jwt_utils._token_cache) == 0
+
+    def test_expired_cache_entry_is_not_served(self):
+        """Test that a cached payload is not returned past its exp claim."""
+        token = create_access_token({"sub": "1"})
+        payload = decode_token(token)
+
+        with patch.object(jwt_utils.time, "time", return_value=payload["exp"] + 1), \
+                patch.object(jwt_utils._jwt, "decode", return_value=payload) as mock_decode:
+            decode_token(token)
+
+        # The stale entry is bypassed and the token is verified again
+        assert mock_decode.call_count == 1
+
+    def test_expired_token_raises_token_expired(self):
+        """Test that expiry is reported separately from other failures."""
+        token = jwt_utils.jwt.encode(
+            {"sub": "1", "exp": 1, "type": "access"},
+            jwt_utils._SECRET,
+            algorithm="HS256",
+        )
+
+        with pytest.raises(TokenExpiredError):
+            decode_token(token)
+
+    def test_token_without_exp_is_rejected(self):
+        """Test that tokens must carry an exp claim."""
+        token = jwt_utils.jwt.encode({"sub": "1"}, jwt_utils._SECRET, algorithm="HS256")
+
+        assert decode_token(token) is None
+
+    def test_cache_key_does_not_contain_token(self):
+        """Test that raw bearer tokens are not stored as cache keys."""
+        token = create_access_token({"sub": "1"})
+        decode_token(token)
+
+        assert token not in jwt_utils._token_cache
+        assert all(len(key) == 16 for key in jwt_utils._token_cache)
+
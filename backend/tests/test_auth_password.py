@@ -0,0 +1,61 @@
+"""Tests for password hashing utilities."""
+
+import asyncio
+from unittest.mock import patch
+
+import bcrypt
+
+from app.auth import password as password_utils
+from app.auth.password import averify_password, hash_password, needs_rehash, verify_password
+
+
+class TestPasswordHashing:
+    """Test cases for bcrypt password hashing."""
+
+    def test_hash_and_verify_roundtrip(self):
+        """Test that a hashed password verifies and a wrong one does not."""
+        hashed = hash_password("SecurePass123!")
+
+        assert hashed.startswith("sha256+$2b$")
+        assert verify_password("SecurePass123!", hashed)
+        assert not verify_password("WrongPass123!", hashed)
+
+    def test_hash_uses_configured_rounds(self):
+        """Test that new hashes are created with the configured cost."""
+        hashed = hash_password("SecurePass123!")
+
+        assert hashed.split("$")[2] == f"{password_utils.BCRYPT_ROUNDS:02d}"
+        assert not needs_rehash(hashed)
+
+    def test_malformed_hash_returns_false(self):
+        """Test that a non-bcrypt hash is rejected instead of raising."""
+        assert not verify_password("SecurePass123!", "not-a-bcrypt-hash")
+
+    def test_non_bcrypt_hash_skips_bcrypt(self):
+        """Test that a hash of the wrong shape is rejected without checkpw."""
+        with patch.object(password_utils.bcrypt, "checkpw") as mock_checkpw:
+            assert not verify_password("SecurePass123!", "$argon2id$v=19$m=65536")
+
+        mock_checkpw.assert_not_called()
+
+    def test_long_passwords_are_not_truncated(self):
+        """Test that passwords differing after 72 bytes do not collide."""
+        hashed = hash_password("x" * 100)
+
+        assert verify_password("x" * 100, hashed)
+        assert not verify_password("x" * 72 + "y" * 28, hashed)
+
+    def test_legacy_hash_verifies_and_needs_rehash(self):
+        """Test that raw-password bcrypt hashes still verify and get upgraded."""
+        legacy = bcrypt.hashpw(b"SecurePass123!", bcrypt.gensalt(rounds=4)).decode()
+
+        assert verify_password("SecurePass123!", legacy)
+        assert not verify_password("WrongPass123!", legacy)
+        assert needs_rehash(legacy)
+
+    def test_async_verify_matches_sync_verify(self):
+        """Test that averify_password gives the same result off the event loop."""
+        hashed = hash_password("SecurePass123!")
+
+        assert asyncio.run(averify_password("SecurePass123!", hashed))
+        assert not asyncio.run(averify_password("WrongPass123!", hashed))
@@ -0,0 +1,26 @@
+"""Tests for the authentication service."""
+
+import hashlib
+from unittest.mock import MagicMock
+
+from app.services import auth_service
+
+
+class TestRefreshTokenRecord:
+    """Test cases for refresh token storage."""
+
+    def test_stores_digest_not_token(self):
+        """Test that only the SHA-256 digest of the issued token is stored."""
+        db = MagicMock()
+
+        token = auth_service.create_refresh_token_record(db, user_id=1)
+
+        record = db.add.call_args.args[0]
+        assert record.token_hash == hashlib.sha256(token.encode("utf-8")).digest()
+        assert token.encode("utf-8") not in record.token_hash
+        db.commit.assert_called_once()
+
+    def test_hash_is_fixed_width(self):
+        """Test that digests are 32 bytes whatever the token length."""
+        assert len(auth_service.hash_refresh_token("a")) == 32
+        assert len(auth_service.hash_refresh_token("x" * 500)) == 32
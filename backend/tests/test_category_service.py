@@ -0,0 +1,63 @@
+"""Tests for the category service."""
+
+import pytest
+from unittest.mock import MagicMock, patch
+from sqlalchemy import event
+
+from app.models.category import Category
+from app.models.document import Document
+from app.services import category_service
+
+
+@pytest.fixture(autouse=True)
+def clear_tree_cache():
+    """Start every test with an empty category tree cache."""
+    category_service.invalidate_category_tree()
+    yield
+    category_service.invalidate_category_tree()
+
+
+@pytest.fixture
+def build_tree():
+    """Patch the database-backed tree builder."""
+    tree = [{"id": 1, "name": "HR", "children": []}]
+    with patch.object(category_service, "_build_category_tree", return_value=tree) as mock_build:
+        yield mock_build
+
+
+class TestCategoryTreeCache:
+    """Test cases for the cached category tree."""
+
+    def test_second_read_is_served_from_cache(self, build_tree):
+        """Test that the tree is built once while cached."""
+        db = MagicMock()
+
+        first = category_service.get_category_tree(db)
+        second = category_service.get_category_tree(db)
+
+        assert build_tree.call_count == 1
+        assert first == second
+
+    def test_returned_tree_is_a_copy(self, build_tree):
+        """Test that mutating a result does not change the cached tree."""
+        db = MagicMock()
+
+        category_service.get_category_tree(db)[0]["children"].append({"id": 2})
+
+        assert category_service.get_category_tree(db)[0]["children"] == []
+
+    def test_invalidate_forces_rebuild(self, build_tree):
+        """Test that invalidation makes the next read rebuild the tree."""
+        db = MagicMock()
+
+        category_service.get_category_tree(db)
+        category_service.invalidate_category_tree()
+        category_service.get_category_tree(db)
+
+        assert build_tree.call_count == 2
+
+    @pytest.mark.parametrize("model", [Category, Document])
+    @pytest.mark.parametrize("event_name", ["after_insert", "after_update", "after_delete"])
+    def test_writes_invalidate_cache(self, model, event_name):
+        """Test that category and document writes drop the cached tree."""
+        assert event.contains(model, event_name, category_service.invalidate_category_tree)
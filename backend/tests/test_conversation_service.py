@@ -0,0 +1,32 @@
+"""Tests for the conversation service."""
+
+from unittest.mock import MagicMock
+
+from app.services import conversation_service
+
+
+class TestLogQuery:
+    """Test cases for query logging."""
+
+    def test_writes_single_insert_and_commits(self):
+        """Test that a log entry is one INSERT committed by default."""
+        db = MagicMock()
+
+        conversation_service.log_query(db, user_id=1, question="Leave policy?", had_answer=True)
+
+        db.execute.assert_called_once()
+        statement = db.execute.call_args.args[0]
+        assert statement.table.name == "query_logs"
+        db.add.assert_not_called()
+        db.commit.assert_called_once()
+
+    def test_commit_false_leaves_transaction_open(self):
+        """Test that the entry can join the caller's transaction."""
+        db = MagicMock()
+
+        conversation_service.log_query(
+            db, user_id=1, question="Leave policy?", had_answer=False, commit=False
+        )
+
+        db.execute.assert_called_once()
+        db.commit.assert_not_called()